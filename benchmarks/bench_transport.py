@@ -0,0 +1,91 @@
+"""
+Benchmark per-call overhead of the SkyEmuClient transports.
+
+Runs the same calls through the in-process, Unix socket and HTTP/TCP
+transports against a fake SkyEmu, so the numbers measure transport and
+client overhead rather than emulator work.
+
+Usage:
+    python benchmarks/bench_transport.py [--iterations N] [--json results.json]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Add parent directory to path so we can import the SkyEmu client
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from skyemu_client import SkyEmuClient
+from skyemu_fake import FakeSkyEmu, serve_http, serve_unix
+from skyemu_transport import HttpTransport, InProcessTransport, UnixSocketTransport
+
+# Calls measured for each transport
+CALLS = {
+    "set_input": lambda client: client.set_input({"A": 1}),
+    "step": lambda client: client.step(1),
+    "read_bytes": lambda client: client.read_bytes([0xD35E, 0xD361, 0xD362]),
+    "read_ranges": lambda client: client.read_ranges([(0xC3A0, 0xC507)]),
+    "get_screen_bytes": lambda client: client.get_screen_bytes(),
+}
+
+def bench(client: SkyEmuClient, call, iterations: int) -> dict:
+    """Time one call repeatedly and summarize the per-call latency in microseconds."""
+    for _ in range(min(50, iterations)):
+        call(client)
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call(client)
+        samples.append((time.perf_counter() - start) * 1e6)
+
+    samples.sort()
+    return {
+        "mean_us": round(statistics.mean(samples), 1),
+        "p50_us": round(samples[len(samples) // 2], 1),
+        "p99_us": round(samples[min(len(samples) - 1, int(len(samples) * 0.99))], 1),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SkyEmuClient transports")
+    parser.add_argument("--iterations", type=int, default=2000, help="Calls per measurement (default: 2000)")
+    parser.add_argument("--json", default=None, help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    fake = FakeSkyEmu()
+    http_server = serve_http(fake, "127.0.0.1", 0)
+    socket_path = os.path.join(tempfile.mkdtemp(), "skyemu.sock")
+    unix_server = serve_unix(fake, socket_path)
+
+    transports = {
+        "in-process": InProcessTransport(fake.handle),
+        "unix-socket": UnixSocketTransport(socket_path),
+        "http-tcp": HttpTransport(*http_server.server_address[:2]),
+    }
+
+    results = {}
+    for transport_name, transport in transports.items():
+        client = SkyEmuClient(transport=transport)
+        results[transport_name] = {}
+        for call_name, call in CALLS.items():
+            results[transport_name][call_name] = bench(client, call, args.iterations)
+        transport.close()
+
+    http_server.shutdown()
+    unix_server.shutdown()
+
+    print(f"{'call':<18}" + "".join(f"{name:>16}" for name in transports))
+    for call_name in CALLS:
+        row = "".join(f"{results[name][call_name]['mean_us']:>13.1f} us" for name in transports)
+        print(f"{call_name:<18}{row}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"iterations": args.iterations, "results": results}, f, indent=2)
+        print(f"Results written to {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""
+Load and soak test for the SkyEmu MCP server.
+
+Starts a fake SkyEmu and one skyemu-mcp process on the SSE transport, then
+drives it with many concurrent MCP sessions running a weighted mix of tool
+calls. Reports throughput, latency percentiles, error rates and server memory
+growth, and can save the results as JSON for comparison across versions.
+
+Usage:
+    python benchmarks/loadtest.py --sessions 10 --duration 60 \\
+        --mix screenshot=2,input=5,memory=3 --json results.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+
+# Add parent directory to path so we can import the fake SkyEmu
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+from skyemu_fake import FakeSkyEmu, serve_http
+
+# Tool call made for each operation in the mix
+OPERATIONS = {
+    "screenshot": ("get_screenshot", {}),
+    "input": ("press_button", {"button": "A", "hold_time": 0.01}),
+    "step": ("step_frames", {"frames": 1}),
+    "memory": ("get_position", {}),
+    "text": ("read_screen_text", {"region": "screen"}),
+    "status": ("get_emulator_status", {}),
+}
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """Parse 'op=weight,op=weight' into a weight per operation."""
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"Unknown operation '{name}'. Choose from {', '.join(OPERATIONS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+def free_port() -> int:
+    """Ask the OS for an unused TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def rss_bytes(pid: int) -> Optional[int]:
+    """Resident set size of a process, or None where /proc is unavailable."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    return sorted_values[index]
+
+class Stats:
+    """Latency samples and error counts per operation."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {name: [] for name in OPERATIONS}
+        self.errors: Dict[str, int] = {name: 0 for name in OPERATIONS}
+        self.error_messages: Dict[str, int] = {}
+
+    def record(self, operation: str, latency: float, error: Optional[str] = None):
+        self.latencies[operation].append(latency)
+        if error is not None:
+            self.errors[operation] += 1
+            self.error_messages[error] = self.error_messages.get(error, 0) + 1
+
+    @property
+    def completed(self) -> int:
+        return sum(len(samples) for samples in self.latencies.values())
+
+    def summary(self, duration: float) -> Dict:
+        operations = {}
+        for name, samples in self.latencies.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            operations[name] = {
+                "calls": len(samples),
+                "errors": self.errors[name],
+                "error_rate": round(self.errors[name] / len(samples), 4),
+                "throughput_per_s": round(len(samples) / duration, 2),
+                "p50_ms": round(percentile(ordered, 0.50) * 1000, 2),
+                "p95_ms": round(percentile(ordered, 0.95) * 1000, 2),
+                "p99_ms": round(percentile(ordered, 0.99) * 1000, 2),
+                "max_ms": round(ordered[-1] * 1000, 2),
+            }
+        total_errors = sum(self.errors.values())
+        return {
+            "calls": self.completed,
+            "errors": total_errors,
+            "error_rate": round(total_errors / self.completed, 4) if self.completed else 0.0,
+            "throughput_per_s": round(self.completed / duration, 2),
+            "operations": operations,
+            "top_errors": dict(sorted(self.error_messages.items(), key=lambda item: -item[1])[:10]),
+        }
+
+async def run_session(url: str, mix: Dict[str, float], deadline: float, stats: Stats, think_time: float):
+    """Run one MCP session issuing tool calls until the deadline."""
+    names = list(mix)
+    weights = [mix[name] for name in names]
+
+    async with sse_client(url, timeout=30) as (read_stream, write_stream):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            while time.monotonic() < deadline:
+                operation = random.choices(names, weights)[0]
+                tool, arguments = OPERATIONS[operation]
+                start = time.perf_counter()
+                error = None
+                try:
+                    result = await session.call_tool(tool, arguments)
+                    if result.isError:
+                        error = result.content[0].text[:200] if result.content else "tool error"
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"[:200]
+                stats.record(operation, time.perf_counter() - start, error)
+                if think_time:
+                    await asyncio.sleep(think_time)
+
+async def sample_memory(pid: int, stats: Stats, interval: float, samples: List[Dict], start: float):
+    """Periodically record server memory and progress."""
+    while True:
+        samples.append({
+            "elapsed_s": round(time.monotonic() - start, 1),
+            "rss_bytes": rss_bytes(pid),
+            "calls": stats.completed,
+        })
+        await asyncio.sleep(interval)
+
+async def wait_for_server(url: str, process: subprocess.Popen, timeout: float = 30.0):
+    """Wait until the MCP server accepts sessions."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"MCP server exited with code {process.returncode}")
+        try:
+            async with sse_client(url, timeout=2) as (read_stream, write_stream):
+                async with ClientSession(read_stream, write_stream) as session:
+                    await session.initialize()
+                    return
+        except Exception:
+            await asyncio.sleep(0.5)
+    raise TimeoutError("MCP server did not start in time")
+
+async def run_load(args, url: str, pid: int) -> Dict:
+    """Drive the server with concurrent sessions and collect results."""
+    stats = Stats()
+    memory_samples: List[Dict] = []
+    start = time.monotonic()
+    deadline = start + args.duration
+
+    sampler = asyncio.create_task(sample_memory(pid, stats, args.sample_interval, memory_samples, start))
+    sessions = [
+        run_session(url, args.mix, deadline, stats, args.think_time)
+        for _ in range(args.sessions)
+    ]
+    session_results = await asyncio.gather(*sessions, return_exceptions=True)
+    sampler.cancel()
+    elapsed = time.monotonic() - start
+
+    memory_samples.append({"elapsed_s": round(elapsed, 1), "rss_bytes": rss_bytes(pid), "calls": stats.completed})
+    rss_values = [sample["rss_bytes"] for sample in memory_samples if sample["rss_bytes"] is not None]
+
+    return {
+        "summary": stats.summary(elapsed),
+        "failed_sessions": [repr(result) for result in session_results if isinstance(result, Exception)],
+        "memory": {
+            "start_bytes": rss_values[0] if rss_values else None,
+            "end_bytes": rss_values[-1] if rss_values else None,
+            "peak_bytes": max(rss_values) if rss_values else None,
+            "growth_bytes": rss_values[-1] - rss_values[0] if rss_values else None,
+            "samples": memory_samples,
+        },
+        "elapsed_s": round(elapsed, 2),
+    }
+
+def git_revision() -> Optional[str]:
+    """Current git commit of the repository, if available."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_report(results: Dict):
+    """Print a human readable summary."""
+    summary = results["summary"]
+    print(f"\n{summary['calls']} calls in {results['elapsed_s']}s "
+          f"({summary['throughput_per_s']}/s), error rate {summary['error_rate']:.2%}")
+    print(f"{'operation':<12}{'calls':>8}{'err%':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, op in summary["operations"].items():
+        print(f"{name:<12}{op['calls']:>8}{op['error_rate']:>8.2%}{op['p50_ms']:>10}"
+              f"{op['p95_ms']:>10}{op['p99_ms']:>10}{op['max_ms']:>10}")
+
+    memory = results["memory"]
+    if memory["start_bytes"] is not None:
+        mb = 1024 * 1024
+        print(f"Server RSS: {memory['start_bytes'] / mb:.1f} MB -> {memory['end_bytes'] / mb:.1f} MB "
+              f"(peak {memory['peak_bytes'] / mb:.1f} MB, growth {memory['growth_bytes'] / mb:+.1f} MB)")
+    for error, count in summary["top_errors"].items():
+        print(f"  {count}x {error}")
+    if results["failed_sessions"]:
+        print(f"{len(results['failed_sessions'])} sessions failed: {results['failed_sessions'][0]}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the SkyEmu MCP server")
+    parser.add_argument("--sessions", type=int, default=10, help="Concurrent MCP sessions (default: 10)")
+    parser.add_argument("--duration", type=float, default=30.0, help="Test duration in seconds (default: 30)")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("screenshot=2,input=5,memory=3"),
+                        help=f"Weighted operation mix, from: {', '.join(OPERATIONS)} "
+                             "(default: screenshot=2,input=5,memory=3)")
+    parser.add_argument("--think-time", type=float, default=0.0,
+                        help="Pause between calls within a session in seconds (default: 0)")
+    parser.add_argument("--fake-latency", type=float, default=0.001,
+                        help="Simulated SkyEmu processing time per request in seconds (default: 0.001)")
+    parser.add_argument("--sample-interval", type=float, default=5.0,
+                        help="Seconds between server memory samples (default: 5)")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for the operation mix")
+    parser.add_argument("--json", default=None, help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    fake = FakeSkyEmu(latency=args.fake_latency)
+    fake_server = serve_http(fake, "127.0.0.1", 0)
+    fake_port = fake_server.server_address[1]
+    mcp_port = free_port()
+    workdir = tempfile.mkdtemp(prefix="skyemu-loadtest-")
+
+    process = subprocess.Popen(
+        [
+            sys.executable, os.path.join(ROOT, "run_server.py"),
+            "--host", "127.0.0.1", "--port", str(fake_port),
+            "--transport", "sse", "--mcp-port", str(mcp_port),
+            "--checkpoint-dir", os.path.join(workdir, "checkpoints"),
+            "--nav-game", "pokemon_red_blue",
+            "--nav-graph", os.path.join(workdir, "world_graph.json"),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{mcp_port}/sse"
+
+    try:
+        asyncio.run(wait_for_server(url, process))
+        print(f"Running {args.sessions} sessions for {args.duration}s against {url}...")
+        results = asyncio.run(run_load(args, url, process.pid))
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        fake_server.shutdown()
+
+    results["config"] = {
+        "sessions": args.sessions,
+        "duration_s": args.duration,
+        "mix": args.mix,
+        "think_time_s": args.think_time,
+        "fake_latency_s": args.fake_latency,
+        "seed": args.seed,
+    }
+    results["environment"] = {
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+    print_report(results)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -9,21 +9,50 @@ import argparse
 import sys
 import os
 
-from skyemu_mcp_server import app, skyemu
+from skyemu_mcp_server import app, skyemu, image_pipeline, checkpoints, enable_navigation
+from skyemu_nav import POSITION_ADDRESSES
+from skyemu_transport import UnixSocketTransport
 
 def main():
     parser = argparse.ArgumentParser(description="Run the SkyEmu MCP server")
     parser.add_argument("--host", default="localhost", help="SkyEmu HTTP server host (default: localhost)")
     parser.add_argument("--port", type=int, default=8080, help="SkyEmu HTTP server port (default: 8080)")
+    parser.add_argument("--unix-socket", default=None,
+                        help="Reach SkyEmu through this Unix domain socket instead of TCP")
+    parser.add_argument("--transport", choices=["stdio", "sse"], default="stdio",
+                        help="MCP transport; sse serves several concurrent sessions over HTTP (default: stdio)")
     parser.add_argument("--mcp-port", type=int, default=None, 
-                        help="MCP server port (default: auto-select from MCP protocol)")
+                        help="MCP server port for the sse transport (default: 8000)")
+    parser.add_argument("--image-workers", type=int, default=2,
+                        help="Maximum concurrent screenshot processing jobs (default: 2)")
+    parser.add_argument("--image-processes", action="store_true",
+                        help="Process screenshots in a process pool instead of threads")
+    parser.add_argument("--checkpoint-dir", default="checkpoints",
+                        help="Directory for checkpoints created by create_checkpoint (default: checkpoints)")
+    parser.add_argument("--nav-game", choices=sorted(POSITION_ADDRESSES), default=None,
+                        help="Track the player's position in this game and enable get_position and go_to")
+    parser.add_argument("--nav-graph", default="world_graph.json",
+                        help="File where the explored world graph is stored (default: world_graph.json)")
     args = parser.parse_args()
     
+    if args.nav_game:
+        enable_navigation(args.nav_game, os.path.abspath(args.nav_graph))
+    
+    checkpoints.root = os.path.abspath(args.checkpoint_dir)
+    
+    # Configure the screenshot processing pool before any tool runs
+    image_pipeline.max_workers = args.image_workers
+    image_pipeline.use_processes = args.image_processes
+    
     # Update SkyEmu client connection parameters if needed
-    if args.host != "localhost" or args.port != 8080:
+    if args.unix_socket:
+        print(f"Connecting to SkyEmu through {args.unix_socket}...")
+        skyemu.__init__(host=args.host, port=args.port, transport=UnixSocketTransport(args.unix_socket),
+                        check_connection=False)
+    elif args.host != "localhost" or args.port != 8080:
         print(f"Connecting to SkyEmu at {args.host}:{args.port}...")
         # Recreate the client with the specified host and port
-        skyemu.__init__(host=args.host, port=args.port)
+        skyemu.__init__(host=args.host, port=args.port, check_connection=False)
     
     # Verify SkyEmu connection
     try:
@@ -48,9 +77,8 @@ def main():
     
     # Start the MCP server
     if args.mcp_port:
-        app.run(transport="stdio", port=args.mcp_port)
-    else:
-        app.run(transport="stdio")
+        app.settings.port = args.mcp_port
+    app.run(transport=args.transport)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,135 @@
+"""
+SkyEmu Checkpoint Store
+
+Content-addressed local storage for screenshots with embedded emulation state,
+so a single /screen?embed_state=1 request produces a restorable checkpoint.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+class CheckpointStore:
+    """Stores checkpoint images by SHA-256 with a JSON Lines index of thumbnails.
+
+    Layout under the root directory:
+        objects/<first two hex digits>/<sha256>.png   full image with embedded state
+        thumbs/<sha256>.png                           small preview image
+        index.jsonl                                   one checkpoint entry per line
+
+    The index is append-only, so adding a checkpoint costs the same however
+    many checkpoints already exist.
+    """
+
+    def __init__(self, root: str = "checkpoints"):
+        """Initialize the store.
+
+        Args:
+            root: Directory holding the objects, thumbnails and index
+        """
+        self.root = os.path.abspath(root)
+        self._lock = threading.Lock()
+        self._index: Optional[List[Dict]] = None
+        self._torn_tail = False
+
+    @property
+    def index_path(self) -> str:
+        """Path of the JSON Lines index file."""
+        return os.path.join(self.root, "index.jsonl")
+
+    def object_path(self, checkpoint_id: str) -> str:
+        """Path of the full checkpoint image for an ID."""
+        return os.path.join(self.root, "objects", checkpoint_id[:2], f"{checkpoint_id}.png")
+
+    def thumbnail_path(self, checkpoint_id: str) -> str:
+        """Path of the thumbnail image for an ID."""
+        return os.path.join(self.root, "thumbs", f"{checkpoint_id}.png")
+
+    def _load_index(self) -> List[Dict]:
+        """Load the index from disk on first use."""
+        if self._index is None:
+            self._index = []
+            if os.path.exists(self.index_path):
+                with open(self.index_path) as f:
+                    for line in f:
+                        self._torn_tail = not line.endswith("\n")
+                        try:
+                            self._index.append(json.loads(line))
+                        except ValueError:
+                            # Skip a line left incomplete by an interrupted write
+                            continue
+        return self._index
+
+    def _append_index(self, entry: Dict):
+        """Append one entry to the index on disk."""
+        line = json.dumps(entry) + "\n"
+        if self._torn_tail:
+            line = "\n" + line
+            self._torn_tail = False
+        with open(self.index_path, "a") as f:
+            f.write(line)
+
+    @staticmethod
+    def _write_once(path: str, data: bytes):
+        """Write a content-addressed file unless it already exists."""
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def add(self, data: bytes, label: str = "", thumbnail: Optional[bytes] = None) -> Dict:
+        """Store a checkpoint image.
+
+        Identical images are stored once; adding one again records a new
+        index entry pointing at the same object.
+
+        Args:
+            data: Image with embedded emulation state
+            label: Optional human readable label
+            thumbnail: Optional encoded preview image
+
+        Returns:
+            The new index entry
+        """
+        checkpoint_id = hashlib.sha256(data).hexdigest()
+        self._write_once(self.object_path(checkpoint_id), data)
+        if thumbnail is not None:
+            self._write_once(self.thumbnail_path(checkpoint_id), thumbnail)
+
+        entry = {
+            "id": checkpoint_id,
+            "label": label,
+            "created": time.time(),
+            "size": len(data),
+            "thumbnail": self.thumbnail_path(checkpoint_id) if thumbnail is not None else None,
+        }
+        with self._lock:
+            os.makedirs(self.root, exist_ok=True)
+            self._load_index().append(entry)
+            self._append_index(entry)
+        return entry
+
+    def list_entries(self, limit: Optional[int] = None) -> List[Dict]:
+        """Index entries, newest first."""
+        with self._lock:
+            entries = list(reversed(self._load_index()))
+        return entries[:limit] if limit is not None else entries
+
+    def resolve(self, checkpoint_id: str) -> str:
+        """Find the object path for a full or abbreviated checkpoint ID.
+
+        Raises:
+            KeyError: If no checkpoint, or more than one, matches
+        """
+        with self._lock:
+            matches = {entry["id"] for entry in self._load_index() if entry["id"].startswith(checkpoint_id)}
+        if not checkpoint_id or not matches:
+            raise KeyError(f"Unknown checkpoint: {checkpoint_id}")
+        if len(matches) > 1:
+            raise KeyError(f"Ambiguous checkpoint ID: {checkpoint_id}")
+        return self.object_path(matches.pop())
@@ -10,19 +10,35 @@ import base64
 from io import BytesIO
 from PIL import Image
 
+from skyemu_scheduler import RequestScheduler, endpoint_priority
+from skyemu_transport import HttpTransport, Transport
+
 class SkyEmuClient:
     """Client for SkyEmu's HTTP Control Server API."""
     
-    def __init__(self, host="localhost", port=8080):
+    def __init__(
+        self,
+        host="localhost",
+        port=8080,
+        scheduler: Optional[RequestScheduler] = None,
+        transport: Optional[Transport] = None,
+        check_connection: bool = True,
+    ):
         """Initialize the SkyEmu client.
         
         Args:
             host: Hostname of the SkyEmu HTTP server
             port: Port number of the SkyEmu HTTP server
+            scheduler: Request scheduler for this instance (a default one is created if omitted)
+            transport: How requests reach SkyEmu (HTTP over TCP to host:port if omitted)
+            check_connection: Whether to ping the server immediately
         """
-        self.base_url = f"http://{host}:{port}"
+        self.transport = transport or HttpTransport(host, port)
+        # Inputs are served before memory reads, and both before screenshots and saves
+        self.scheduler = scheduler or RequestScheduler()
         # Verify the server is running
-        self.ping()
+        if check_connection:
+            self.ping()
     
     def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
         """Make a GET request to the SkyEmu API.
@@ -34,9 +50,9 @@ class SkyEmuClient:
         Returns:
             Response from the server
         """
-        url = f"{self.base_url}/{endpoint}"
-        response = requests.get(url, params=params)
-        response.raise_for_status()  # Raise exception for error status codes
+        with self.scheduler.slot(endpoint_priority(endpoint)):
+            response = self.transport.request(endpoint, params)
+            response.raise_for_status()  # Raise exception for error status codes
         return response
     
     def ping(self) -> bool:
@@ -82,13 +98,25 @@ class SkyEmuClient:
         Returns:
             PIL Image object of the current screen
         """
+        img_data = BytesIO(self.get_screen_bytes(format, embed_state))
+        return Image.open(img_data)
+    
+    def get_screen_bytes(self, format="png", embed_state=False) -> bytes:
+        """Get the encoded screenshot bytes without decoding them.
+        
+        Args:
+            format: Image format (png, jpg, or bmp)
+            embed_state: Whether to embed emulation state in the image
+            
+        Returns:
+            Encoded image data as returned by the server
+        """
         params = {"format": format}
         if embed_state:
             params["embed_state"] = 1
             
         response = self._get("screen", params)
-        img_data = BytesIO(response.content)
-        return Image.open(img_data)
+        return response.content
     
     def read_bytes(self, addresses: List[int], map_id: int = 0) -> List[int]:
         """Read bytes from the emulated memory.
@@ -100,25 +128,40 @@ class SkyEmuClient:
         Returns:
             List of byte values read from memory
         """
-        params = {}
-        for i, addr in enumerate(addresses):
-            params[f"addr"] = hex(addr)[2:]  # Convert to hex string without 0x prefix
+        # Each address is sent as its own addr parameter so they are all
+        # read in a single request
+        params = {"addr": [hex(addr)[2:] for addr in addresses]}
             
         if map_id != 0:
             params["map"] = map_id
             
         response = self._get("read_byte", params)
         # Response is in hex format
-        hex_data = response.text
-        bytes_data = []
-        
-        # Parse hex string into bytes
-        for i in range(0, len(hex_data), 2):
-            if i + 1 < len(hex_data):
-                byte_val = int(hex_data[i:i+2], 16)
-                bytes_data.append(byte_val)
-                
-        return bytes_data
+        return list(self._parse_hex(response.text))
+    
+    def read_ranges(self, ranges: List[Tuple[int, int]], map_id: int = 0) -> bytes:
+        """Read one or more contiguous memory ranges in a single request.
+        
+        Args:
+            ranges: List of (start, end) address pairs, both inclusive
+            map_id: Memory map ID (0 for default, 7 for ARM7, 9 for ARM9 in NDS)
+            
+        Returns:
+            Bytes of all ranges concatenated in the order given
+        """
+        params = {"addr": [f"{start:x}-{end:x}" for start, end in ranges]}
+        
+        if map_id != 0:
+            params["map"] = map_id
+            
+        response = self._get("read_byte", params)
+        return self._parse_hex(response.text)
+    
+    @staticmethod
+    def _parse_hex(hex_data: str) -> bytes:
+        """Parse a hex string response into bytes, ignoring a trailing nibble."""
+        hex_data = hex_data.strip()
+        return bytes.fromhex(hex_data[:len(hex_data) - len(hex_data) % 2])
     
     def write_bytes(self, address_value_pairs: Dict[int, int], map_id: int = 0) -> bool:
         """Write bytes to the emulated memory.
@@ -0,0 +1,243 @@
+"""
+SkyEmu RL Environment
+
+A Gym-style environment wrapper around SkyEmuClient for reinforcement-learning
+rollouts, plus a vectorized variant that drives several SkyEmu instances at once.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from skyemu_client import SkyEmuClient
+
+# Default discrete action set for Game Boy / GBA games: no-op plus each button
+DEFAULT_ACTIONS = [
+    [],
+    ["A"],
+    ["B"],
+    ["Up"],
+    ["Down"],
+    ["Left"],
+    ["Right"],
+    ["Start"],
+    ["Select"],
+]
+
+class ReadPlan:
+    """A precompiled set of memory reads producing a fixed observation vector.
+
+    Addresses are sorted and coalesced into contiguous ranges once, so every
+    observation costs a single read_byte request regardless of how many
+    addresses are observed.
+    """
+
+    def __init__(self, addresses: Sequence[int], map_id: int = 0, max_gap: int = 16):
+        """Compile a read plan.
+
+        Args:
+            addresses: Memory addresses to observe, in observation order
+            map_id: Memory map ID passed to read_byte
+            max_gap: Largest run of unused bytes allowed inside a single range
+        """
+        if not addresses:
+            raise ValueError("ReadPlan requires at least one address")
+
+        self.addresses = list(addresses)
+        self.map_id = map_id
+        self.ranges: List[Tuple[int, int]] = []
+
+        # Coalesce nearby addresses into (start, end) ranges
+        for addr in sorted(set(self.addresses)):
+            if self.ranges and addr - self.ranges[-1][1] <= max_gap + 1:
+                self.ranges[-1] = (self.ranges[-1][0], addr)
+            else:
+                self.ranges.append((addr, addr))
+
+        # Map each address to its offset in the concatenated response
+        offsets = {}
+        position = 0
+        for start, end in self.ranges:
+            for addr in range(start, end + 1):
+                offsets[addr] = position
+                position += 1
+        self.size = position
+        self.index = np.array([offsets[addr] for addr in self.addresses], dtype=np.intp)
+
+    def read(self, client: SkyEmuClient) -> np.ndarray:
+        """Execute the plan against a client.
+
+        Returns:
+            uint8 array with one entry per address, in observation order
+        """
+        raw = client.read_ranges(self.ranges, self.map_id)
+        if len(raw) != self.size:
+            raise ValueError(f"Expected {self.size} bytes from read plan, got {len(raw)}")
+        return np.frombuffer(raw, dtype=np.uint8)[self.index]
+
+class SkyEmuEnv:
+    """Gym-style environment backed by a single SkyEmu instance.
+
+    reset() returns (observation, info) and step() returns
+    (observation, reward, terminated, truncated, info), matching the
+    Gymnasium API without depending on it.
+    """
+
+    def __init__(
+        self,
+        client: SkyEmuClient,
+        state_path: str,
+        observation_addresses: Sequence[int],
+        actions: Optional[List[List[str]]] = None,
+        frame_skip: int = 4,
+        map_id: int = 0,
+        reward_fn: Optional[Callable[[np.ndarray, np.ndarray], float]] = None,
+        done_fn: Optional[Callable[[np.ndarray], bool]] = None,
+        max_steps: Optional[int] = None,
+        hold_repeats: bool = False,
+    ):
+        """Initialize the environment.
+
+        Args:
+            client: Connected SkyEmu client
+            state_path: Save state loaded on every reset
+            observation_addresses: Memory addresses forming the observation vector
+            actions: Discrete action set, each entry a list of buttons held together
+            frame_skip: Frames to advance per step
+            map_id: Memory map ID for observation reads
+            reward_fn: Optional function of (previous_obs, obs) returning a reward
+            done_fn: Optional function of obs returning True when the episode ends
+            max_steps: Optional step limit after which episodes are truncated
+            hold_repeats: Keep buttons held when an action repeats, instead of
+                releasing them for one frame so the game sees a new press
+        """
+        self.client = client
+        self.state_path = state_path
+        self.actions = actions if actions is not None else DEFAULT_ACTIONS
+        self.frame_skip = frame_skip
+        self.read_plan = ReadPlan(observation_addresses, map_id)
+        self.reward_fn = reward_fn
+        self.done_fn = done_fn
+        self.max_steps = max_steps
+        self.hold_repeats = hold_repeats
+
+        self.buttons = sorted({button for action in self.actions for button in action})
+        self._last_input: Optional[Dict[str, int]] = None
+        self._last_obs: Optional[np.ndarray] = None
+        self._steps = 0
+
+    @property
+    def observation_size(self) -> int:
+        """Length of the observation vector."""
+        return len(self.read_plan.addresses)
+
+    def reset(self) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Restore the start state and return the first observation."""
+        self.client.load_state(self.state_path)
+        self._apply_input({button: 0 for button in self.buttons}, force=True)
+        self._steps = 0
+        self._last_obs = self.read_plan.read(self.client)
+        return self._last_obs, {}
+
+    def step(self, action: int) -> Tuple[np.ndarray, float, bool, bool, Dict[str, Any]]:
+        """Apply an action, advance frame_skip frames and observe.
+
+        Args:
+            action: Index into the action set
+        """
+        if self._last_obs is None:
+            raise RuntimeError("reset() must be called before step()")
+
+        pressed = set(self.actions[action])
+        input_state = {button: int(button in pressed) for button in self.buttons}
+        if pressed and input_state == self._last_input and not self.hold_repeats:
+            # Release for one frame so a repeated action is a new press, not a longer hold
+            self._apply_input({button: 0 for button in self.buttons})
+            self.client.step(1)
+        self._apply_input(input_state)
+        self.client.step(self.frame_skip)
+        obs = self.read_plan.read(self.client)
+        self._steps += 1
+
+        reward = float(self.reward_fn(self._last_obs, obs)) if self.reward_fn else 0.0
+        terminated = bool(self.done_fn(obs)) if self.done_fn else False
+        truncated = self.max_steps is not None and self._steps >= self.max_steps
+        self._last_obs = obs
+        return obs, reward, terminated, truncated, {"steps": self._steps}
+
+    def _apply_input(self, input_state: Dict[str, int], force: bool = False):
+        """Send input state, skipping the request when nothing changed."""
+        if force or input_state != self._last_input:
+            self.client.set_input(input_state)
+            self._last_input = input_state
+
+class SkyEmuVecEnv:
+    """Runs several SkyEmuEnv instances in lockstep.
+
+    Each environment talks to its own SkyEmu instance, so requests to different
+    instances are issued concurrently from a thread pool. Finished environments
+    are reset automatically; their final observation is placed in
+    info["final_observation"].
+    """
+
+    def __init__(self, envs: List[SkyEmuEnv]):
+        """Initialize the vectorized environment.
+
+        Args:
+            envs: Environments, each bound to a different SkyEmu instance
+        """
+        if not envs:
+            raise ValueError("SkyEmuVecEnv requires at least one environment")
+        self.envs = envs
+        self.executor = ThreadPoolExecutor(max_workers=len(envs))
+
+    @classmethod
+    def from_endpoints(cls, endpoints: List[Tuple[str, int]], **env_kwargs) -> "SkyEmuVecEnv":
+        """Create one environment per (host, port) SkyEmu endpoint.
+
+        Args:
+            endpoints: SkyEmu HTTP server addresses
+            env_kwargs: Arguments passed to every SkyEmuEnv
+        """
+        return cls([SkyEmuEnv(SkyEmuClient(host, port), **env_kwargs) for host, port in endpoints])
+
+    @property
+    def num_envs(self) -> int:
+        """Number of environments."""
+        return len(self.envs)
+
+    def reset(self) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+        """Reset every environment."""
+        results = list(self.executor.map(lambda env: env.reset(), self.envs))
+        return np.stack([obs for obs, _ in results]), [info for _, info in results]
+
+    def step(self, actions: Sequence[int]):
+        """Step every environment with its own action.
+
+        Returns:
+            Tuple of stacked observations, rewards, terminated flags,
+            truncated flags and a list of info dictionaries
+        """
+        if len(actions) != len(self.envs):
+            raise ValueError(f"Expected {len(self.envs)} actions, got {len(actions)}")
+        results = list(self.executor.map(self._step_one, self.envs, actions))
+
+        obs = np.stack([result[0] for result in results])
+        rewards = np.array([result[1] for result in results], dtype=np.float32)
+        terminated = np.array([result[2] for result in results], dtype=bool)
+        truncated = np.array([result[3] for result in results], dtype=bool)
+        infos = [result[4] for result in results]
+        return obs, rewards, terminated, truncated, infos
+
+    @staticmethod
+    def _step_one(env: SkyEmuEnv, action: int):
+        """Step one environment, resetting it when the episode ends."""
+        obs, reward, terminated, truncated, info = env.step(action)
+        if terminated or truncated:
+            info["final_observation"] = obs
+            obs, _ = env.reset()
+        return obs, reward, terminated, truncated, info
+
+    def close(self):
+        """Shut down the worker threads."""
+        self.executor.shutdown(wait=True)
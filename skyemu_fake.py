@@ -0,0 +1,211 @@
+"""
+Fake SkyEmu
+
+An in-memory stand-in for SkyEmu's HTTP Control Server, used with the
+in-process transport in tests and served over TCP or a Unix socket for
+benchmarks and load tests.
+"""
+import json
+import os
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+def _values(params: Dict[str, Any], key: str) -> List[str]:
+    """All values of a query parameter as strings, whether given once or as a list."""
+    value = params.get(key)
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return [str(v) for v in value]
+    return [str(value)]
+
+class FakeSkyEmu:
+    """Emulates the SkyEmu HTTP Control Server endpoints in memory.
+
+    Requests are handled one at a time, like SkyEmu itself. An optional
+    per-request latency simulates emulator work.
+    """
+
+    def __init__(self, width: int = 160, height: int = 144, latency: float = 0.0):
+        """Initialize the fake emulator.
+
+        Args:
+            width: Screen width in pixels
+            height: Screen height in pixels
+            latency: Seconds to sleep while handling each request
+        """
+        self.width = width
+        self.height = height
+        self.latency = latency
+        self.memory: Dict[Tuple[int, int], int] = {}
+        self.inputs: Dict[str, int] = {}
+        self.frames = 0
+        self.run_mode = "pause"
+        self.rom_path: Optional[str] = None
+        self._screen: Optional[bytes] = None
+        self._lock = threading.Lock()
+
+    def screen_bytes(self) -> bytes:
+        """A PNG of the fake screen, generated once."""
+        if self._screen is None:
+            from PIL import Image
+
+            image = Image.new("RGB", (self.width, self.height), (155, 188, 15))
+            buffered = BytesIO()
+            image.save(buffered, format="PNG")
+            self._screen = buffered.getvalue()
+        return self._screen
+
+    def handle(self, endpoint: str, params: Dict[str, Any]) -> Tuple[int, bytes]:
+        """Handle one request.
+
+        Args:
+            endpoint: Endpoint name without the leading slash
+            params: Query parameters; values may be single values or lists
+
+        Returns:
+            Tuple of (HTTP status code, response body)
+        """
+        with self._lock:
+            if self.latency:
+                time.sleep(self.latency)
+            handler = getattr(self, f"_handle_{endpoint}", None)
+            if handler is None:
+                return 404, b"unknown endpoint"
+            try:
+                return 200, handler(params)
+            except (ValueError, OSError) as e:
+                return 400, str(e).encode()
+
+    def _handle_ping(self, params) -> bytes:
+        return b"pong"
+
+    def _handle_step(self, params) -> bytes:
+        frames = _values(params, "frames")
+        self.frames += int(frames[0]) if frames else 1
+        self.run_mode = "step"
+        return b"ok"
+
+    def _handle_run(self, params) -> bytes:
+        self.run_mode = "run"
+        return b"ok"
+
+    def _handle_input(self, params) -> bytes:
+        for name in params:
+            self.inputs[name] = int(_values(params, name)[0])
+        return b"ok"
+
+    def _handle_status(self, params) -> bytes:
+        status = {
+            "emulator": "FakeSkyEmu",
+            "run-mode": self.run_mode,
+            "rom-loaded": self.rom_path is not None,
+            "inputs": self.inputs,
+            "frames": self.frames,
+        }
+        if self.rom_path:
+            status["rom-path"] = self.rom_path
+        return json.dumps(status).encode()
+
+    def _handle_read_byte(self, params) -> bytes:
+        map_id = int(_values(params, "map")[0]) if "map" in params else 0
+        output = []
+        for spec in _values(params, "addr"):
+            start, _, end = spec.partition("-")
+            start = int(start, 16)
+            end = int(end, 16) if end else start
+            for addr in range(start, end + 1):
+                output.append(f"{self.memory.get((map_id, addr), 0):02x}")
+        return "".join(output).encode()
+
+    def _handle_write_byte(self, params) -> bytes:
+        map_id = int(_values(params, "map")[0]) if "map" in params else 0
+        for key in params:
+            if key != "map":
+                self.memory[(map_id, int(key, 16))] = int(_values(params, key)[0], 16) & 0xFF
+        return b"ok"
+
+    def _handle_screen(self, params) -> bytes:
+        return self.screen_bytes()
+
+    def _handle_save(self, params) -> bytes:
+        with open(_values(params, "path")[0], "wb") as f:
+            f.write(self.screen_bytes())
+        return b"ok"
+
+    def _handle_load(self, params) -> bytes:
+        path = _values(params, "path")[0]
+        if not os.path.exists(path):
+            raise ValueError(f"No such save state: {path}")
+        return b"ok"
+
+    def _handle_load_rom(self, params) -> bytes:
+        self.rom_path = _values(params, "path")[0]
+        self.run_mode = "pause" if _values(params, "pause") else "run"
+        return b"ok"
+
+def _make_request_handler(fake: FakeSkyEmu, tcp: bool = True):
+    """Create an HTTP request handler class bound to a fake emulator."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Send headers and body in one write instead of waiting on delayed ACKs
+        wbufsize = -1
+        disable_nagle_algorithm = tcp
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            status, body = fake.handle(url.path.lstrip("/"), parse_qs(url.query))
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def address_string(self):
+            # Unix socket clients have no (host, port) address
+            return str(self.client_address[0]) if self.client_address else "unix"
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+class _ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+def serve_http(fake: FakeSkyEmu, host: str = "localhost", port: int = 0) -> ThreadingHTTPServer:
+    """Serve a fake emulator over TCP from a background thread.
+
+    Args:
+        fake: Fake emulator to serve
+        host: Interface to bind
+        port: Port to bind (0 picks a free port, see server.server_address)
+
+    Returns:
+        The running server; call shutdown() to stop it
+    """
+    server = ThreadingHTTPServer((host, port), _make_request_handler(fake))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def serve_unix(fake: FakeSkyEmu, path: str) -> socketserver.UnixStreamServer:
+    """Serve a fake emulator over a Unix domain socket from a background thread.
+
+    Args:
+        fake: Fake emulator to serve
+        path: Socket path to create
+
+    Returns:
+        The running server; call shutdown() to stop it
+    """
+    if os.path.exists(path):
+        os.unlink(path)
+    server = _ThreadingUnixHTTPServer(path, _make_request_handler(fake, tcp=False))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
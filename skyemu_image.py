@@ -0,0 +1,165 @@
+"""
+SkyEmu Image Pipeline
+
+Runs screenshot decoding, transformation and encoding in a bounded worker pool
+so that image work never blocks the MCP server's event loop.
+"""
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+from multiprocessing import shared_memory
+from typing import Dict, Optional, Tuple
+
+from PIL import Image
+
+def _transform(data: bytes, ops: Dict) -> bytes:
+    """Decode an image, apply the requested operations and re-encode it.
+
+    Args:
+        data: Encoded image data
+        ops: Operations to apply; supports 'crop' (left, top, right, bottom),
+            'scale' (float factor), 'hash' (return an average hash instead of
+            an image) and 'format' (output format, default PNG)
+
+    Returns:
+        Encoded image data, or the hex digest as ASCII bytes for 'hash'
+
+    Raises:
+        ValueError: If the crop box is not inside the image
+    """
+    image = Image.open(BytesIO(data))
+    image.load()
+
+    if ops.get("crop"):
+        left, top, right, bottom = ops["crop"]
+        width, height = image.size
+        if not (0 <= left < right <= width and 0 <= top < bottom <= height):
+            raise ValueError(f"Crop box {list(ops['crop'])} is outside the {width}x{height} image")
+        image = image.crop((left, top, right, bottom))
+
+    if ops.get("hash"):
+        # 8x8 average hash: one bit per pixel brighter than the mean
+        small = image.convert("L").resize((8, 8), Image.BILINEAR)
+        pixels = list(small.getdata())
+        mean = sum(pixels) / len(pixels)
+        bits = 0
+        for pixel in pixels:
+            bits = (bits << 1) | (pixel > mean)
+        return f"{bits:016x}".encode()
+
+    scale = ops.get("scale", 1.0)
+    if scale != 1.0:
+        width, height = image.size
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        image = image.resize(size, Image.NEAREST)
+
+    output_format = ops.get("format", "PNG")
+    if output_format.upper() in ("JPEG", "JPG") and image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+
+    buffered = BytesIO()
+    image.save(buffered, format=output_format)
+    return buffered.getvalue()
+
+def _transform_shared(name: str, size: int, ops: Dict) -> bytes:
+    """Process-pool entry point reading the frame from shared memory."""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        data = bytes(shm.buf[:size])
+    finally:
+        shm.close()
+    return _transform(data, ops)
+
+class ImagePipeline:
+    """Bounded worker pool for screenshot processing.
+
+    With use_processes=False (the default) work runs in a thread pool; Pillow
+    releases the GIL for most decode, resize and encode work. With
+    use_processes=True a process pool is used and frame data is handed over
+    through shared memory instead of being pickled.
+
+    Awaiting callers that are cancelled cancel their pending job; a job that is
+    already running finishes in the background and its result is discarded.
+    """
+
+    def __init__(self, max_workers: int = 2, use_processes: bool = False):
+        """Initialize the pipeline.
+
+        Args:
+            max_workers: Maximum number of concurrent image jobs
+            use_processes: Use a process pool instead of a thread pool
+        """
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self._executor: Optional[Executor] = None
+
+    @property
+    def executor(self) -> Executor:
+        """The worker pool, created on first use."""
+        if self._executor is None:
+            if self.use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="skyemu-image"
+                )
+        return self._executor
+
+    async def process(self, data: bytes, **ops) -> bytes:
+        """Run an image job in the pool.
+
+        Args:
+            data: Encoded image data
+            ops: Operations understood by the worker (crop, scale, hash, format)
+
+        Returns:
+            Result of the job
+        """
+        loop = asyncio.get_running_loop()
+
+        if not self.use_processes:
+            return await loop.run_in_executor(self.executor, _transform, data, ops)
+
+        shm = shared_memory.SharedMemory(create=True, size=max(1, len(data)))
+        try:
+            shm.buf[:len(data)] = data
+            return await loop.run_in_executor(
+                self.executor, _transform_shared, shm.name, len(data), ops
+            )
+        finally:
+            shm.close()
+            shm.unlink()
+
+    async def encode(
+        self,
+        data: bytes,
+        format: str = "PNG",
+        scale: float = 1.0,
+        crop: Optional[Tuple[int, int, int, int]] = None,
+    ) -> bytes:
+        """Decode, optionally crop and scale, and re-encode an image.
+
+        Args:
+            data: Encoded image data
+            format: Output image format
+            scale: Resize factor applied after cropping
+            crop: Optional (left, top, right, bottom) box inside the image
+
+        Returns:
+            Encoded image data
+
+        Raises:
+            ValueError: If the crop box is not inside the image
+        """
+        return await self.process(data, format=format, scale=scale, crop=crop)
+
+    async def average_hash(self, data: bytes) -> str:
+        """Compute a 64-bit average hash of an image as 16 hex digits."""
+        result = await self.process(data, hash=True)
+        return result.decode()
+
+    def shutdown(self):
+        """Stop the worker pool, cancelling jobs that have not started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
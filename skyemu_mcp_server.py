@@ -6,22 +6,168 @@ An MCP server that provides tools for controlling a SkyEmu instance through the
 import asyncio
 import os
 import json
-import time
 import base64
-from io import BytesIO
-from typing import Dict, List, Optional, Any, Union
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Any, Set, Union
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 from PIL import Image
 
+from skyemu_checkpoints import CheckpointStore
 from skyemu_client import SkyEmuClient
+from skyemu_image import ImagePipeline
+from skyemu_nav import POSITION_ADDRESSES, Navigator, next_direction
+from skyemu_scheduler import PRIORITY_BULK, PRIORITY_INPUT, PRIORITY_MEMORY, PRIORITY_NAMES
+from skyemu_text import GAME_LAYOUTS, TextReader
 
-# Initialize the SkyEmu client
-skyemu = SkyEmuClient()
+# Initialize the SkyEmu client; the connection is checked when the server starts
+skyemu = SkyEmuClient(check_connection=False)
+
+# Screenshot processing runs in a bounded pool, off the event loop
+image_pipeline = ImagePipeline()
+
+# Decodes on-screen text directly from the game's tile map
+text_reader = TextReader(skyemu)
+
+# Checkpoints captured as screenshots with embedded state
+checkpoints = CheckpointStore()
+
+# Records where the player can walk and plans routes over it; only set up
+# for games with known position addresses, see enable_navigation
+navigator: Optional[Navigator] = None
 
 # Initialize the MCP server
 app = FastMCP("skyemu-mcp")
 
+# Buttons currently held down by tools
+held_buttons: Set[str] = set()
+
+def enable_navigation(game: str, graph_path: Optional[str] = None):
+    """Turn on position tracking and the go_to tool for a supported game.
+    
+    Args:
+        game: Key into skyemu_nav.POSITION_ADDRESSES
+        graph_path: Optional file the world graph is loaded from and saved to
+    """
+    global navigator
+    navigator = Navigator(skyemu, game, graph_path)
+
+NAVIGATION_DISABLED = (
+    "Navigation is not configured. Start the server with --nav-game "
+    f"({', '.join(POSITION_ADDRESSES)}) to enable it."
+)
+
+# The long-running action in progress; starting another one interrupts it
+_active_action: Optional[asyncio.Task] = None
+_interrupted: Set[asyncio.Task] = set()
+
+# Serializes interrupting the running action and starting the next one
+_action_lock = asyncio.Lock()
+
+# Buttons held by the action running in the current task, released if it is cancelled
+_action_buttons: ContextVar[Optional[Set[str]]] = ContextVar("_action_buttons", default=None)
+
+# Releases in flight, kept referenced until they finish
+_releases: Set[asyncio.Task] = set()
+
+# Worker threads per request priority class. Client calls may wait for a
+# scheduler slot, which must block neither the event loop nor calls of a
+# higher priority class queued behind them.
+_executors = {
+    priority: ThreadPoolExecutor(max_workers=4, thread_name_prefix=f"skyemu-{name}")
+    for priority, name in PRIORITY_NAMES.items()
+}
+
+async def _call(priority: Optional[int], fn, *args):
+    """Run a blocking call in a worker thread, off the event loop.
+    
+    Args:
+        priority: Priority class of the SkyEmu requests fn makes (see
+            skyemu_scheduler), or None for local work such as disk writes,
+            which runs in the default executor
+        fn: Blocking function to call
+        args: Positional arguments for fn
+    """
+    loop = asyncio.get_running_loop()
+    executor = _executors[priority] if priority is not None else None
+    return await loop.run_in_executor(executor, fn, *args)
+
+async def _set_buttons(buttons: List[str], state: int):
+    """Set buttons pressed (1) or released (0) and track which are held.
+    
+    Buttons count as held from before the press is sent until the release has
+    been sent, so an interrupted call never leaves a pressed button untracked.
+    """
+    action_buttons = _action_buttons.get()
+    if state:
+        held_buttons.update(buttons)
+        if action_buttons is not None:
+            action_buttons.update(buttons)
+    await _call(PRIORITY_INPUT, skyemu.set_input, {button: state for button in buttons})
+    if not state:
+        held_buttons.difference_update(buttons)
+        if action_buttons is not None:
+            action_buttons.difference_update(buttons)
+
+async def _release(buttons: List[str]):
+    """Release buttons, finishing even if the caller is cancelled again meanwhile."""
+    task = asyncio.ensure_future(_set_buttons(buttons, 0))
+    _releases.add(task)
+    task.add_done_callback(_releases.discard)
+    await asyncio.shield(task)
+
+async def _press(button: str, hold_time: float):
+    """Press and release a button without blocking the event loop."""
+    await _set_buttons([button], 1)
+    try:
+        await asyncio.sleep(hold_time)
+    finally:
+        await _release([button])
+
+async def _report_progress(ctx: Optional[Context], progress: float, total: Optional[float]):
+    """Send a progress notification if the tool was called with a context."""
+    if ctx is not None:
+        await ctx.report_progress(progress, total)
+
+async def _interrupt_active_action() -> bool:
+    """Cancel the running action and wait for its cleanup to finish."""
+    task = _active_action
+    if task is None or task.done():
+        return False
+    _interrupted.add(task)
+    task.cancel()
+    await asyncio.wait([task])
+    return True
+
+async def _guarded(coro) -> str:
+    """Run an action, releasing the buttons it holds if it is cancelled."""
+    buttons: Set[str] = set()
+    _action_buttons.set(buttons)
+    try:
+        return await coro
+    except asyncio.CancelledError:
+        if buttons:
+            await _release(list(buttons))
+        raise
+
+async def _run_action(coro) -> str:
+    """Run a long action as a cancellable task, interrupting any stale one."""
+    global _active_action
+    async with _action_lock:
+        await _interrupt_active_action()
+        task = asyncio.ensure_future(_guarded(coro))
+        _active_action = task
+    try:
+        return await task
+    except asyncio.CancelledError:
+        # An action interrupted before it started never ran its coroutine
+        coro.close()
+        if task in _interrupted:
+            _interrupted.discard(task)
+            return "Action interrupted before completion"
+        raise
+
 @app.tool()
 async def press_button(button: str, hold_time: float = 0.2) -> str:
     """Press a button on the emulated controller.
@@ -30,11 +176,16 @@ async def press_button(button: str, hold_time: float = 0.2) -> str:
         button: The button to press (e.g., "A", "B", "Up", "Down", "Left", "Right", "Start", "Select")
         hold_time: How long to hold the button in seconds
     """
-    skyemu.press_button(button, hold_time)
+    await _press(button, hold_time)
     return f"Button {button} pressed for {hold_time} seconds"
 
 @app.tool()
-async def press_sequence(buttons: List[str], hold_time: float = 0.2, delay_between: float = 0.1) -> str:
+async def press_sequence(
+    buttons: List[str],
+    hold_time: float = 0.2,
+    delay_between: float = 0.1,
+    ctx: Context = None
+) -> str:
     """Press a sequence of buttons in order.
     
     Args:
@@ -42,12 +193,16 @@ async def press_sequence(buttons: List[str], hold_time: float = 0.2, delay_betwe
         hold_time: How long to hold each button in seconds
         delay_between: Delay between button presses in seconds
     """
-    for button in buttons:
-        skyemu.press_button(button, hold_time)
-        if delay_between > 0 and button != buttons[-1]:
-            time.sleep(delay_between)
+    async def run():
+        for i, button in enumerate(buttons):
+            await _press(button, hold_time)
+            await _report_progress(ctx, i + 1, len(buttons))
+            if delay_between > 0 and i < len(buttons) - 1:
+                await asyncio.sleep(delay_between)
+        
+        return f"Button sequence {', '.join(buttons)} executed"
     
-    return f"Button sequence {', '.join(buttons)} executed"
+    return await _run_action(run())
 
 @app.tool()
 async def hold_buttons(buttons: List[str]) -> str:
@@ -56,8 +211,7 @@ async def hold_buttons(buttons: List[str]) -> str:
     Args:
         buttons: List of buttons to hold down
     """
-    input_state = {button: 1 for button in buttons}
-    skyemu.set_input(input_state)
+    await _set_buttons(buttons, 1)
     return f"Buttons {', '.join(buttons)} are being held down"
 
 @app.tool()
@@ -67,14 +221,13 @@ async def release_buttons(buttons: List[str]) -> str:
     Args:
         buttons: List of buttons to release
     """
-    input_state = {button: 0 for button in buttons}
-    skyemu.set_input(input_state)
+    await _set_buttons(buttons, 0)
     return f"Buttons {', '.join(buttons)} have been released"
 
 @app.tool()
 async def release_all_buttons() -> str:
     """Release all buttons that might be currently held down."""
-    status = skyemu.get_status()
+    status = await _call(PRIORITY_MEMORY, skyemu.get_status)
     all_inputs = status.get("inputs", {})
     
     # Create a dictionary to release all buttons that are pressed
@@ -83,22 +236,74 @@ async def release_all_buttons() -> str:
         if value > 0:
             release_inputs[input_name] = 0
     
-    skyemu.set_input(release_inputs)
+    await _call(PRIORITY_INPUT, skyemu.set_input, release_inputs)
+    held_buttons.clear()
     return "All buttons released"
 
+async def _fetch_screen(embed_state: bool = False) -> bytes:
+    """Fetch the encoded screen without blocking the event loop."""
+    return await _call(PRIORITY_BULK, skyemu.get_screen_bytes, "png", embed_state)
+
 @app.tool()
-async def get_screenshot() -> str:
+async def get_screenshot(scale: float = 1.0, crop: Optional[List[int]] = None) -> str:
     """Get a screenshot of the current game state.
     
+    Args:
+        scale: Resize factor for the returned image (e.g. 0.5 or 2)
+        crop: Optional [left, top, right, bottom] region of the screen to return, in pixels
+    
     Returns:
         Base64 encoded PNG image of the current screen
     """
-    screen = skyemu.get_screen(embed_state=False)
-    buffered = BytesIO()
-    screen.save(buffered, format="PNG")
-    img_str = base64.b64encode(buffered.getvalue()).decode()
+    if crop is not None and len(crop) != 4:
+        return "Invalid crop: expected [left, top, right, bottom]"
+    if crop is not None and (crop[2] <= crop[0] or crop[3] <= crop[1]):
+        return "Invalid crop: right must be greater than left and bottom greater than top"
+    if scale <= 0:
+        return "Invalid scale: must be greater than 0"
+        
+    data = await _fetch_screen()
+    try:
+        png = await image_pipeline.encode(data, format="PNG", scale=scale, crop=crop)
+    except ValueError as e:
+        return f"Invalid crop: {e}"
+    img_str = base64.b64encode(png).decode()
     return img_str
 
+@app.tool()
+async def get_screen_hash() -> str:
+    """Get a perceptual hash of the current screen.
+    
+    Comparing hashes is a cheap way to tell whether the screen changed
+    without transferring a full screenshot.
+    
+    Returns:
+        64-bit average hash as 16 hex digits
+    """
+    data = await _fetch_screen()
+    return await image_pipeline.average_hash(data)
+
+@app.tool()
+async def read_screen_text(game: str = "pokemon_red_blue", region: str = "dialogue") -> str:
+    """Read on-screen text directly from game memory, without a screenshot.
+    
+    Much cheaper than a screenshot for reading dialogue and menus.
+    
+    Args:
+        game: Game whose text layout to use (currently "pokemon_red_blue")
+        region: "dialogue" for the text box, or "screen" for all text including menus
+    
+    Returns:
+        Decoded text, one line per row of tiles
+    """
+    if game not in GAME_LAYOUTS:
+        return f"Unsupported game: {game}. Supported: {', '.join(sorted(GAME_LAYOUTS))}"
+    if region not in GAME_LAYOUTS[game].regions:
+        return f"Unknown region: {region}. Available: {', '.join(GAME_LAYOUTS[game].regions)}"
+        
+    lines = await _call(PRIORITY_MEMORY, text_reader.read_lines, game, region)
+    return "\n".join(lines) if lines else "(no text on screen)"
+
 @app.tool()
 async def step_frames(frames: int = 1) -> str:
     """Step the emulator forward by a specific number of frames.
@@ -106,13 +311,13 @@ async def step_frames(frames: int = 1) -> str:
     Args:
         frames: Number of frames to step forward
     """
-    skyemu.step(frames)
+    await _call(PRIORITY_INPUT, skyemu.step, frames)
     return f"Stepped forward {frames} frames"
 
 @app.tool()
 async def run_emulator() -> str:
     """Start/resume the emulator at normal speed."""
-    skyemu.run()
+    await _call(PRIORITY_INPUT, skyemu.run)
     return "Emulator is now running"
 
 @app.tool()
@@ -125,7 +330,7 @@ async def save_state(path: str) -> str:
     if not os.path.isabs(path):
         path = os.path.abspath(path)
         
-    skyemu.save_state(path)
+    await _call(PRIORITY_BULK, skyemu.save_state, path)
     return f"Game state saved to {path}"
 
 @app.tool()
@@ -138,9 +343,54 @@ async def load_state(path: str) -> str:
     if not os.path.isabs(path):
         path = os.path.abspath(path)
         
-    skyemu.load_state(path)
+    await _call(PRIORITY_BULK, skyemu.load_state, path)
     return f"Game state loaded from {path}"
 
+@app.tool()
+async def create_checkpoint(label: str = "") -> str:
+    """Capture the screen and emulation state in a single request.
+    
+    Cheaper than save_state plus get_screenshot. Restore with restore_checkpoint.
+    
+    Args:
+        label: Optional description of the checkpoint
+    
+    Returns:
+        JSON string with the checkpoint ID and metadata
+    """
+    data = await _fetch_screen(embed_state=True)
+    thumbnail = await image_pipeline.encode(data, format="PNG", scale=0.5)
+    entry = await _call(None, checkpoints.add, data, label, thumbnail)
+    return json.dumps(entry, indent=2)
+
+@app.tool()
+async def list_checkpoints(limit: int = 20) -> str:
+    """List stored checkpoints, newest first.
+    
+    Args:
+        limit: Maximum number of checkpoints to return
+    
+    Returns:
+        JSON string with checkpoint IDs, labels, timestamps and thumbnail paths
+    """
+    entries = await _call(None, checkpoints.list_entries, limit)
+    return json.dumps(entries, indent=2)
+
+@app.tool()
+async def restore_checkpoint(checkpoint_id: str) -> str:
+    """Restore a checkpoint created with create_checkpoint.
+    
+    Args:
+        checkpoint_id: Full checkpoint ID or a unique prefix of it
+    """
+    try:
+        path = await _call(None, checkpoints.resolve, checkpoint_id)
+    except KeyError as e:
+        return str(e.args[0])
+        
+    await _call(PRIORITY_BULK, skyemu.load_state, path)
+    return f"Checkpoint {checkpoint_id} restored"
+
 @app.tool()
 async def load_rom(path: str, pause: bool = False) -> str:
     """Load a ROM file into the emulator.
@@ -152,7 +402,7 @@ async def load_rom(path: str, pause: bool = False) -> str:
     if not os.path.isabs(path):
         path = os.path.abspath(path)
         
-    skyemu.load_rom(path, pause)
+    await _call(PRIORITY_BULK, skyemu.load_rom, path, pause)
     return f"ROM loaded from {path}"
 
 @app.tool()
@@ -162,13 +412,24 @@ async def get_emulator_status() -> str:
     Returns:
         JSON string containing emulator status information
     """
-    status = skyemu.get_status()
+    status = await _call(PRIORITY_MEMORY, skyemu.get_status)
     return json.dumps(status, indent=2)
 
+@app.tool()
+async def get_client_metrics() -> str:
+    """Get request scheduling metrics for the SkyEmu connection.
+    
+    Returns:
+        JSON string with the concurrency limit, in-flight requests and per-class
+        queue depth, latency and error counts
+    """
+    return json.dumps(skyemu.scheduler.metrics(), indent=2)
+
 @app.tool()
 async def execute_sequence(
     actions: List[Dict[str, Any]], 
-    delay_between: float = 0.5
+    delay_between: float = 0.5,
+    ctx: Context = None
 ) -> str:
     """Execute a sequence of actions with delays in between.
     
@@ -188,47 +449,54 @@ async def execute_sequence(
         - 'buttons': List of buttons to release
     - 'wait': Wait for a specified amount of time
         - 'time': Time to wait in seconds
-    """
-    result_messages = []
     
-    for i, action in enumerate(actions):
-        action_type = action.get('type')
+    The sequence can be stopped with cancel_action or by starting another
+    long-running action; any buttons it holds are released.
+    """
+    async def run():
+        result_messages = []
         
-        if action_type == 'press':
-            button = action.get('button')
-            hold_time = action.get('hold_time', 0.2)
-            skyemu.press_button(button, hold_time)
-            result_messages.append(f"Pressed {button} for {hold_time}s")
+        for i, action in enumerate(actions):
+            action_type = action.get('type')
             
-        elif action_type == 'hold':
-            buttons = action.get('buttons', [])
-            input_state = {button: 1 for button in buttons}
-            skyemu.set_input(input_state)
-            result_messages.append(f"Holding buttons: {', '.join(buttons)}")
+            if action_type == 'press':
+                button = action.get('button')
+                hold_time = action.get('hold_time', 0.2)
+                await _press(button, hold_time)
+                result_messages.append(f"Pressed {button} for {hold_time}s")
+                
+            elif action_type == 'hold':
+                buttons = action.get('buttons', [])
+                await _set_buttons(buttons, 1)
+                result_messages.append(f"Holding buttons: {', '.join(buttons)}")
+                
+            elif action_type == 'release':
+                buttons = action.get('buttons', [])
+                await _set_buttons(buttons, 0)
+                result_messages.append(f"Released buttons: {', '.join(buttons)}")
+                
+            elif action_type == 'wait':
+                wait_time = action.get('time', delay_between)
+                await asyncio.sleep(wait_time)
+                result_messages.append(f"Waited for {wait_time}s")
             
-        elif action_type == 'release':
-            buttons = action.get('buttons', [])
-            input_state = {button: 0 for button in buttons}
-            skyemu.set_input(input_state)
-            result_messages.append(f"Released buttons: {', '.join(buttons)}")
+            await _report_progress(ctx, i + 1, len(actions))
             
-        elif action_type == 'wait':
-            wait_time = action.get('time', delay_between)
-            time.sleep(wait_time)
-            result_messages.append(f"Waited for {wait_time}s")
+            # Add delay between actions except after the last one
+            if i < len(actions) - 1 and action_type != 'wait':
+                await asyncio.sleep(delay_between)
         
-        # Add delay between actions except after the last one
-        if i < len(actions) - 1 and action_type != 'wait':
-            time.sleep(delay_between)
+        return "\n".join(result_messages)
     
-    return "\n".join(result_messages)
+    return await _run_action(run())
 
 @app.tool()
 async def perform_directional_movement(
     direction: str, 
     steps: int = 1, 
     hold_time: float = 0.2, 
-    delay_between: float = 0.1
+    delay_between: float = 0.1,
+    ctx: Context = None
 ) -> str:
     """Perform a directional movement in the game.
     
@@ -237,21 +505,116 @@ async def perform_directional_movement(
         steps: Number of button presses to perform
         hold_time: How long to hold the button for each press
         delay_between: Delay between button presses
+    
+    With navigation enabled (--nav-game), the position before and after each
+    press is recorded in the world graph used by go_to.
     """
     if direction not in ["Up", "Down", "Left", "Right"]:
         return f"Invalid direction: {direction}. Must be Up, Down, Left, or Right."
     
-    for _ in range(steps):
-        skyemu.press_button(direction, hold_time)
-        if _ < steps - 1:  # No delay after the last press
-            time.sleep(delay_between)
+    if steps < 1:
+        return f"Invalid steps: {steps}. Must be at least 1."
+    
+    async def run():
+        for i in range(steps):
+            await _press(direction, hold_time)
+            await _report_progress(ctx, i + 1, steps)
+            if i < steps - 1:  # No delay after the last press
+                await asyncio.sleep(delay_between)
+        
+        return f"Moved {direction} for {steps} steps"
+    
+    async def run_tracked():
+        # Record each press in the world graph so go_to learns the walls agents find
+        position = await _call(PRIORITY_MEMORY, navigator.position)
+        try:
+            for i in range(steps):
+                await _press(direction, hold_time)
+                await asyncio.sleep(delay_between)
+                after = await _call(PRIORITY_MEMORY, navigator.position)
+                navigator.graph.record(position, direction, after)
+                position = after
+                await _report_progress(ctx, i + 1, steps)
+        finally:
+            navigator.save()
+        
+        map_id, x, y = position
+        return f"Moved {direction} for {steps} steps, now at map {map_id} ({x}, {y})"
+    
+    return await _run_action(run() if navigator is None else run_tracked())
+
+@app.tool()
+async def get_position() -> str:
+    """Get the player's current map and tile coordinates.
+    
+    Returns:
+        JSON string with map_id, x, y and a summary of the explored world graph
+    """
+    if navigator is None:
+        return NAVIGATION_DISABLED
+    map_id, x, y = await _call(PRIORITY_MEMORY, navigator.position)
+    return json.dumps({"map_id": map_id, "x": x, "y": y, "explored": navigator.graph.stats()}, indent=2)
+
+@app.tool()
+async def go_to(
+    map_id: int,
+    x: int,
+    y: int,
+    hold_time: float = 0.2,
+    settle_time: float = 0.1,
+    max_replans: int = 20,
+    ctx: Context = None
+) -> str:
+    """Walk to a map position using the explored world graph.
+    
+    Plans a route with A* over known tiles and doors (assuming unexplored tiles on
+    the target map are walkable), executes it, and replans when a move is blocked.
+    
+    Args:
+        map_id: Target map ID
+        x: Target tile X coordinate
+        y: Target tile Y coordinate
+        hold_time: How long to hold each direction
+        settle_time: Delay after each press before reading the position
+        max_replans: How many times to replan before giving up
+    """
+    if navigator is None:
+        return NAVIGATION_DISABLED
+    
+    goal = (map_id, x, y)
+    
+    async def run():
+        # Presses go through _press so a cancelled walk releases its button
+        presses = 0
+        position = await _call(PRIORITY_MEMORY, navigator.position)
+        steps = navigator.route(position, goal, max_replans)
+        direction = next(steps, None)
+        try:
+            while direction is not None:
+                await _press(direction, hold_time)
+                await asyncio.sleep(settle_time)
+                position = await _call(PRIORITY_MEMORY, navigator.position)
+                presses += 1
+                await _report_progress(ctx, presses, None)
+                direction = next_direction(steps, position)
+        finally:
+            navigator.save()
+        return position == goal, presses, position
     
-    return f"Moved {direction} for {steps} steps"
+    result = await _run_action(run())
+    if isinstance(result, str):
+        return result
+    reached, presses, position = result
+    
+    if reached:
+        return f"Reached map {map_id} ({x}, {y}) in {presses} moves"
+    return f"Could not reach map {map_id} ({x}, {y}); stopped at map {position[0]} ({position[1]}, {position[2]}) after {presses} moves"
 
 @app.tool()
 async def navigate_menu(
     selections: List[Dict[str, Any]],
-    delay_between: float = 0.5
+    delay_between: float = 0.5,
+    ctx: Context = None
 ) -> str:
     """Navigate through menu selections with directional and confirmation buttons.
     
@@ -264,35 +627,54 @@ async def navigate_menu(
             - 'delay_after': Additional delay after this selection (default: 0)
         delay_between: Default delay between actions in seconds
     """
-    results = []
-    
-    for selection in selections:
-        direction = selection.get('direction')
-        steps = selection.get('steps', 1)
-        confirm = selection.get('confirm', False)
-        confirm_button = selection.get('confirm_button', 'A')
-        delay_after = selection.get('delay_after', 0)
-        
-        # Move in the specified direction
-        if direction and direction in ["Up", "Down", "Left", "Right"]:
-            for _ in range(steps):
-                skyemu.press_button(direction, 0.2)
-                time.sleep(0.1)
-            results.append(f"Moved {direction} {steps} times")
-            time.sleep(delay_between)
+    async def run():
+        results = []
         
-        # Press confirmation button if requested
-        if confirm:
-            skyemu.press_button(confirm_button, 0.2)
-            results.append(f"Pressed {confirm_button} to confirm")
-            time.sleep(delay_between)
+        for i, selection in enumerate(selections):
+            direction = selection.get('direction')
+            steps = selection.get('steps', 1)
+            confirm = selection.get('confirm', False)
+            confirm_button = selection.get('confirm_button', 'A')
+            delay_after = selection.get('delay_after', 0)
+            
+            # Move in the specified direction
+            if direction and direction in ["Up", "Down", "Left", "Right"]:
+                for _ in range(steps):
+                    await _press(direction, 0.2)
+                    await asyncio.sleep(0.1)
+                results.append(f"Moved {direction} {steps} times")
+                await asyncio.sleep(delay_between)
+            
+            # Press confirmation button if requested
+            if confirm:
+                await _press(confirm_button, 0.2)
+                results.append(f"Pressed {confirm_button} to confirm")
+                await asyncio.sleep(delay_between)
+            
+            # Additional delay if specified
+            if delay_after > 0:
+                await asyncio.sleep(delay_after)
+                results.append(f"Waited for {delay_after}s")
+            
+            await _report_progress(ctx, i + 1, len(selections))
         
-        # Additional delay if specified
-        if delay_after > 0:
-            time.sleep(delay_after)
-            results.append(f"Waited for {delay_after}s")
+        return "\n".join(results)
     
-    return "\n".join(results)
+    return await _run_action(run())
+
+@app.tool()
+async def cancel_action() -> str:
+    """Stop the long-running action in progress and release any buttons it held.
+    
+    Long-running actions are press_sequence, execute_sequence,
+    perform_directional_movement, go_to and navigate_menu. Starting one of
+    them also interrupts the previous one.
+    """
+    async with _action_lock:
+        cancelled = await _interrupt_active_action()
+    if cancelled:
+        return "Action cancelled"
+    return "No action is running"
 
 if __name__ == "__main__":
     print("Starting SkyEmu MCP Server")
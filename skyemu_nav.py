@@ -0,0 +1,308 @@
+"""
+SkyEmu Navigation
+
+Tracks the player's map and position from game memory, builds an incremental
+graph of walkable tiles and map transitions, and plans routes over it with A*.
+"""
+import heapq
+import json
+import os
+import threading
+import time
+from typing import Dict, Generator, List, Optional, Set, Tuple
+
+from skyemu_client import SkyEmuClient
+
+# (map_id, x, y)
+Position = Tuple[int, int, int]
+
+DIRECTIONS = {
+    "Up": (0, -1),
+    "Down": (0, 1),
+    "Left": (-1, 0),
+    "Right": (1, 0),
+}
+
+# Memory addresses of (map ID, x, y) per game
+POSITION_ADDRESSES = {
+    # wCurMap, wXCoord, wYCoord
+    "pokemon_red_blue": (0xD35E, 0xD362, 0xD361),
+}
+
+def next_direction(route: Generator[str, Position, None], position: Position) -> Optional[str]:
+    """Report the position a move led to and get the next direction, or None when the route ends."""
+    try:
+        return route.send(position)
+    except StopIteration:
+        return None
+
+class WorldGraph:
+    """Incremental graph of observed movement between tiles.
+
+    Successful moves are stored as edges, which also captures doors and warps
+    between maps. A tile edge is only marked blocked after two failed moves in
+    the same direction, because the first press may just turn the player.
+    """
+
+    def __init__(self):
+        self.edges: Dict[Tuple[int, int, int, str], Position] = {}
+        self.blocked: Set[Tuple[int, int, int, str]] = set()
+        self._failed_once: Set[Tuple[int, int, int, str]] = set()
+        self._lock = threading.Lock()
+
+    def record(self, before: Position, direction: str, after: Position) -> bool:
+        """Record the outcome of one directional press.
+
+        Args:
+            before: Position before the press
+            direction: Direction pressed
+            after: Position after the press
+
+        Returns:
+            True if the graph changed
+        """
+        key = (*before, direction)
+        with self._lock:
+            if after != before:
+                self._failed_once.discard(key)
+                self.blocked.discard(key)
+                if self.edges.get(key) == after:
+                    return False
+                self.edges[key] = after
+                return True
+
+            if key in self.blocked:
+                return False
+            if key in self._failed_once:
+                self.blocked.add(key)
+                return True
+            self._failed_once.add(key)
+            return False
+
+    def is_blocked(self, position: Position, direction: str) -> bool:
+        """Whether a move has failed often enough to be treated as a wall."""
+        with self._lock:
+            return (*position, direction) in self.blocked
+
+    def _neighbors(self, position: Position, goal_map: int):
+        """Yield (direction, next_position) pairs worth exploring from a tile."""
+        map_id, x, y = position
+        for direction, (dx, dy) in DIRECTIONS.items():
+            key = (map_id, x, y, direction)
+            if key in self.edges:
+                yield direction, self.edges[key]
+            elif key not in self.blocked and map_id == goal_map:
+                # Optimistically assume unexplored tiles on the goal map are walkable
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < 256 and 0 <= ny < 256:
+                    yield direction, (map_id, nx, ny)
+
+    def plan(self, start: Position, goal: Position, max_expansions: int = 20000) -> Optional[List[str]]:
+        """Find a shortest known-or-plausible route with A*.
+
+        Known edges (including warps) can be used on any map; unexplored tiles
+        are only assumed walkable on the goal's map.
+
+        Args:
+            start: Current position
+            goal: Target position
+            max_expansions: Search budget
+
+        Returns:
+            List of directions to press, or None if no route was found
+        """
+        goal_map, goal_x, goal_y = goal
+
+        def heuristic(position: Position) -> int:
+            map_id, x, y = position
+            if map_id != goal_map:
+                return 0
+            return abs(x - goal_x) + abs(y - goal_y)
+
+        with self._lock:
+            open_heap = [(heuristic(start), 0, start)]
+            came_from: Dict[Position, Tuple[Position, str]] = {}
+            cost = {start: 0}
+            expansions = 0
+
+            while open_heap and expansions < max_expansions:
+                _, g, position = heapq.heappop(open_heap)
+                if position == goal:
+                    path = []
+                    while position != start:
+                        position, direction = came_from[position]
+                        path.append(direction)
+                    return path[::-1]
+                if g > cost[position]:
+                    continue
+                expansions += 1
+
+                for direction, neighbor in self._neighbors(position, goal_map):
+                    new_cost = g + 1
+                    if new_cost < cost.get(neighbor, new_cost + 1):
+                        cost[neighbor] = new_cost
+                        came_from[neighbor] = (position, direction)
+                        heapq.heappush(open_heap, (new_cost + heuristic(neighbor), new_cost, neighbor))
+        return None
+
+    def to_json(self) -> str:
+        """Serialize the graph compactly as flat integer/direction lists."""
+        with self._lock:
+            data = {
+                "edges": [[*key, *value] for key, value in self.edges.items()],
+                "blocked": [list(key) for key in self.blocked],
+            }
+        return json.dumps(data, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, text: str) -> "WorldGraph":
+        """Restore a graph serialized with to_json."""
+        data = json.loads(text)
+        graph = cls()
+        for map_id, x, y, direction, next_map, next_x, next_y in data.get("edges", []):
+            graph.edges[(map_id, x, y, direction)] = (next_map, next_x, next_y)
+        for map_id, x, y, direction in data.get("blocked", []):
+            graph.blocked.add((map_id, x, y, direction))
+        return graph
+
+    def stats(self) -> Dict:
+        """Number of maps, tiles, edges and blocked moves known."""
+        with self._lock:
+            tiles = {key[:3] for key in self.edges} | set(self.edges.values())
+            return {
+                "maps": len({tile[0] for tile in tiles}),
+                "tiles": len(tiles),
+                "edges": len(self.edges),
+                "blocked": len(self.blocked),
+            }
+
+class Navigator:
+    """Moves the player while recording observations into a WorldGraph."""
+
+    def __init__(self, client: SkyEmuClient, game: str = "pokemon_red_blue", graph_path: Optional[str] = None):
+        """Initialize the navigator.
+
+        Args:
+            client: SkyEmu client used for input and memory reads
+            game: Key into POSITION_ADDRESSES
+            graph_path: Optional file the graph is loaded from and saved to
+        """
+        if game not in POSITION_ADDRESSES:
+            raise ValueError(f"Unsupported game: {game}")
+        self.client = client
+        self.addresses = list(POSITION_ADDRESSES[game])
+        self.graph_path = graph_path
+        self.graph = WorldGraph()
+        self.load()
+
+    def load(self):
+        """Load the graph from graph_path, if configured and present."""
+        if self.graph_path and os.path.exists(self.graph_path):
+            with open(self.graph_path) as f:
+                self.graph = WorldGraph.from_json(f.read())
+
+    def position(self) -> Position:
+        """Read (map_id, x, y) in a single memory request."""
+        map_id, x, y = self.client.read_bytes(self.addresses)
+        return map_id, x, y
+
+    def move(self, direction: str, hold_time: float = 0.2, settle_time: float = 0.1) -> Tuple[Position, Position]:
+        """Press a direction once and record where the player ended up.
+
+        Args:
+            direction: "Up", "Down", "Left" or "Right"
+            hold_time: How long to hold the button
+            settle_time: Delay before reading the new position
+
+        Returns:
+            Tuple of (position before, position after)
+        """
+        before = self.position()
+        self.client.press_button(direction, hold_time)
+        time.sleep(settle_time)
+        after = self.position()
+        self.graph.record(before, direction, after)
+        return before, after
+
+    def _expected(self, position: Position, direction: str) -> Position:
+        """Where a press should lead, from a known edge or the adjacent tile."""
+        known = self.graph.edges.get((*position, direction))
+        if known is not None:
+            return known
+        map_id, x, y = position
+        dx, dy = DIRECTIONS[direction]
+        return map_id, x + dx, y + dy
+
+    def route(self, start: Position, goal: Position, max_replans: int = 20) -> Generator[str, Position, None]:
+        """Directions toward a goal, replanning whenever a move does not go as expected.
+
+        The caller presses each yielded direction and sends back the position
+        it led to, which is recorded in the graph. This lets synchronous and
+        asyncio callers drive the same walk with their own way of pressing.
+
+        Args:
+            start: Current (map_id, x, y)
+            goal: Target (map_id, x, y)
+            max_replans: How many times to replan before giving up
+        """
+        position = start
+        for _ in range(max_replans + 1):
+            if position == goal:
+                return
+            path = self.graph.plan(position, goal)
+            if not path:
+                return
+
+            for direction in path:
+                expected = self._expected(position, direction)
+                after = yield direction
+                self.graph.record(position, direction, after)
+                if after == position and not self.graph.is_blocked(position, direction):
+                    # The first press may only turn the player; press again before replanning
+                    after = yield direction
+                    self.graph.record(position, direction, after)
+                position = after
+                if position != expected:
+                    # Blocked, turned in place or warped: replan from here
+                    break
+
+    def go_to(
+        self,
+        goal: Position,
+        hold_time: float = 0.2,
+        settle_time: float = 0.1,
+        max_replans: int = 20,
+    ) -> Tuple[bool, int, Position]:
+        """Walk to a position, replanning whenever a move does not go as expected.
+
+        Args:
+            goal: Target (map_id, x, y)
+            hold_time: How long to hold each direction
+            settle_time: Delay after each press before reading the position
+            max_replans: How many times to replan before giving up
+
+        Returns:
+            Tuple of (reached, presses used, final position)
+        """
+        presses = 0
+        position = self.position()
+        steps = self.route(position, goal, max_replans)
+        direction = next(steps, None)
+
+        while direction is not None:
+            self.client.press_button(direction, hold_time)
+            time.sleep(settle_time)
+            position = self.position()
+            presses += 1
+            direction = next_direction(steps, position)
+
+        return position == goal, presses, position
+
+    def save(self):
+        """Persist the graph to graph_path, if configured."""
+        if not self.graph_path:
+            return
+        tmp_path = self.graph_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.write(self.graph.to_json())
+        os.replace(tmp_path, self.graph_path)
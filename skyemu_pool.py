@@ -0,0 +1,216 @@
+"""
+SkyEmu Session Pool
+
+Keeps pre-booted SkyEmu instances parked at named savestates so that starting
+a new episode costs a single load_state instead of a ROM boot and intro macro.
+"""
+import logging
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+from skyemu_client import SkyEmuClient
+
+logger = logging.getLogger(__name__)
+
+# Buttons released before an instance is re-parked
+BUTTONS = ["A", "B", "Up", "Down", "Left", "Right", "Start", "Select", "L", "R"]
+
+# Delay before retrying a failed re-park, doubled per consecutive failure
+RETRY_DELAY = 0.5
+MAX_RETRY_DELAY = 30.0
+
+class WarmSession:
+    """An emulator instance checked out of a SessionPool."""
+
+    def __init__(self, pool: "SessionPool", client: SkyEmuClient, endpoint: Tuple[str, int]):
+        self.pool = pool
+        self.client = client
+        self.endpoint = endpoint
+        self.parked_at: Optional[str] = None
+        self.failures = 0
+
+    @property
+    def healthy(self) -> bool:
+        """Whether the last attempt to re-park this instance succeeded."""
+        return self.failures == 0
+
+    def release(self):
+        """Return the instance to the pool for background re-parking."""
+        self.pool.checkin(self)
+
+class SessionPool:
+    """Pool of SkyEmu instances parked at named savestates.
+
+    Warm states are produced once by booting the ROM on the first instance and
+    running each warm-up macro in order, saving a state after each one. The
+    state files are reused on later runs if they already exist. Every instance
+    is then parked at the default state. Checked-in instances are re-parked by
+    a background thread, so checkouts normally return immediately.
+    """
+
+    def __init__(
+        self,
+        endpoints: List[Tuple[str, int]],
+        rom_path: str,
+        state_dir: str,
+        warmups: Dict[str, Callable[[SkyEmuClient], None]],
+        default_state: Optional[str] = None,
+    ):
+        """Initialize the pool.
+
+        Args:
+            endpoints: (host, port) pairs of SkyEmu HTTP servers to manage
+            rom_path: ROM loaded on every instance
+            state_dir: Directory where warm savestates are stored
+            warmups: Ordered mapping of state name to a macro that advances the
+                emulator from the previous state to this one
+            default_state: State instances are parked at (defaults to the first)
+        """
+        if not endpoints:
+            raise ValueError("SessionPool requires at least one endpoint")
+        if not warmups:
+            raise ValueError("SessionPool requires at least one warm-up state")
+
+        self.endpoints = endpoints
+        self.rom_path = os.path.abspath(rom_path)
+        self.state_dir = os.path.abspath(state_dir)
+        self.warmups = warmups
+        self.default_state = default_state or next(iter(warmups))
+
+        self._idle: List[WarmSession] = []
+        self._idle_cond = threading.Condition()
+        self._refill: "queue.Queue[Optional[WarmSession]]" = queue.Queue()
+        self._refill_thread: Optional[threading.Thread] = None
+
+    def state_path(self, name: str) -> str:
+        """Path of the savestate for a named warm state."""
+        if name not in self.warmups:
+            raise KeyError(f"Unknown warm state: {name}")
+        return os.path.join(self.state_dir, f"{name}.png")
+
+    def start(self):
+        """Create the warm states if needed, park every instance and start refilling."""
+        os.makedirs(self.state_dir, exist_ok=True)
+
+        sessions = []
+        for host, port in self.endpoints:
+            session = WarmSession(self, SkyEmuClient(host, port), (host, port))
+            session.client.load_rom(self.rom_path, pause=True)
+            sessions.append(session)
+
+        self._prepare_states(sessions[0].client)
+
+        for session in sessions:
+            self._park(session, self.default_state)
+            with self._idle_cond:
+                self._idle.append(session)
+                self._idle_cond.notify()
+
+        self._refill_thread = threading.Thread(
+            target=self._refill_loop, name="skyemu-pool-refill", daemon=True
+        )
+        self._refill_thread.start()
+
+    def _prepare_states(self, client: SkyEmuClient):
+        """Boot through each warm-up macro, saving any state that is missing."""
+        if all(os.path.exists(self.state_path(name)) for name in self.warmups):
+            return
+
+        for name, warmup in self.warmups.items():
+            path = self.state_path(name)
+            if os.path.exists(path):
+                client.load_state(path)
+            else:
+                warmup(client)
+                client.save_state(path)
+
+    def _park(self, session: WarmSession, name: str):
+        """Load a warm state on an instance."""
+        session.client.load_state(self.state_path(name))
+        session.parked_at = name
+
+    def checkout(self, name: Optional[str] = None, timeout: Optional[float] = None) -> WarmSession:
+        """Take an instance positioned at a warm state.
+
+        Args:
+            name: Warm state to start from (defaults to the pool's default state)
+            timeout: Seconds to wait for an idle instance, or None to wait forever
+
+        Returns:
+            The checked-out session
+        """
+        name = name or self.default_state
+        self.state_path(name)  # Validate the name before waiting
+
+        with self._idle_cond:
+            if not self._idle_cond.wait_for(lambda: self._idle, timeout):
+                raise TimeoutError("No idle SkyEmu instance available")
+            # Prefer an instance already parked at the requested state
+            session = next((s for s in self._idle if s.parked_at == name), self._idle[0])
+            self._idle.remove(session)
+
+        if session.parked_at != name:
+            try:
+                self._park(session, name)
+            except Exception:
+                # Hand the instance back for re-parking instead of losing it
+                session.parked_at = None
+                self.checkin(session)
+                raise
+        # The session is about to be mutated, so it is no longer parked anywhere
+        session.parked_at = None
+        return session
+
+    def checkin(self, session: WarmSession):
+        """Return an instance; it is re-parked in the background."""
+        self._refill.put(session)
+
+    @contextmanager
+    def session(self, name: Optional[str] = None, timeout: Optional[float] = None):
+        """Context manager that checks out an instance and returns it afterwards."""
+        session = self.checkout(name, timeout)
+        try:
+            yield session
+        finally:
+            self.checkin(session)
+
+    def idle_count(self) -> int:
+        """Number of instances ready for checkout."""
+        with self._idle_cond:
+            return len(self._idle)
+
+    def _refill_loop(self):
+        """Re-park returned instances and make them available again."""
+        while True:
+            session = self._refill.get()
+            if session is None:
+                return
+            try:
+                session.client.set_input({button: 0 for button in BUTTONS})
+                self._park(session, self.default_state)
+            except Exception as e:
+                # Keep the instance in the pool and retry with backoff
+                session.failures += 1
+                delay = min(MAX_RETRY_DELAY, RETRY_DELAY * 2 ** (session.failures - 1))
+                logger.warning(
+                    "Failed to re-park SkyEmu instance at %s (attempt %d), retrying in %.1fs: %s",
+                    session.endpoint, session.failures, delay, e,
+                )
+                retry = threading.Timer(delay, self._refill.put, args=(session,))
+                retry.daemon = True
+                retry.start()
+                continue
+            session.failures = 0
+            with self._idle_cond:
+                self._idle.append(session)
+                self._idle_cond.notify()
+
+    def stop(self):
+        """Stop the background refill thread."""
+        if self._refill_thread is not None:
+            self._refill.put(None)
+            self._refill_thread.join()
+            self._refill_thread = None
@@ -0,0 +1,174 @@
+"""
+SkyEmu Request Scheduler
+
+Prioritizes and limits concurrent requests to a SkyEmu HTTP server so that
+inputs stay responsive while heavy observation traffic is running.
+"""
+import heapq
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+# Priority classes, lower values are served first
+PRIORITY_INPUT = 0
+PRIORITY_MEMORY = 1
+PRIORITY_BULK = 2
+
+PRIORITY_NAMES = {
+    PRIORITY_INPUT: "input",
+    PRIORITY_MEMORY: "memory",
+    PRIORITY_BULK: "bulk",
+}
+
+# Priority class of each SkyEmu endpoint; unknown endpoints are treated as memory
+ENDPOINT_PRIORITIES = {
+    "input": PRIORITY_INPUT,
+    "step": PRIORITY_INPUT,
+    "run": PRIORITY_INPUT,
+    "ping": PRIORITY_MEMORY,
+    "status": PRIORITY_MEMORY,
+    "read_byte": PRIORITY_MEMORY,
+    "write_byte": PRIORITY_MEMORY,
+    "screen": PRIORITY_BULK,
+    "save": PRIORITY_BULK,
+    "load": PRIORITY_BULK,
+    "load_rom": PRIORITY_BULK,
+}
+
+def endpoint_priority(endpoint: str) -> int:
+    """Priority class for a SkyEmu endpoint."""
+    return ENDPOINT_PRIORITIES.get(endpoint, PRIORITY_MEMORY)
+
+class RequestScheduler:
+    """Priority queue with an adaptive concurrency limit for one SkyEmu instance.
+
+    Waiting requests are admitted strictly by priority class, then arrival
+    order. The concurrency limit follows AIMD on the latency of input and
+    memory requests: it grows slowly while they stay under the target latency
+    and is cut back when they exceed it. The limit never drops below two, and
+    bulk requests never take the last free slot, so an input can always be
+    admitted without waiting behind a screenshot.
+    """
+
+    def __init__(
+        self,
+        min_limit: int = 2,
+        max_limit: int = 4,
+        target_latency: float = 0.05,
+        smoothing: float = 0.2,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            min_limit: Lowest concurrency limit, at least 2 so one slot stays reserved
+            max_limit: Highest concurrency limit
+            target_latency: Input/memory latency in seconds above which the limit shrinks
+            smoothing: Weight of each new sample in the latency moving averages
+        """
+        if min_limit < 2:
+            raise ValueError("min_limit must be at least 2 to keep a slot reserved for input and memory requests")
+        if max_limit < min_limit:
+            raise ValueError("max_limit must not be less than min_limit")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_latency = target_latency
+        self.smoothing = smoothing
+
+        self.limit = float(min_limit)
+        self.in_flight = 0
+        self._cond = threading.Condition()
+        self._waiting = []  # Heap of (priority, sequence)
+        self._sequence = 0
+
+        self.queue_depth = {priority: 0 for priority in PRIORITY_NAMES}
+        self.completed = {priority: 0 for priority in PRIORITY_NAMES}
+        self.errors = {priority: 0 for priority in PRIORITY_NAMES}
+        self.latency = {priority: 0.0 for priority in PRIORITY_NAMES}
+        self.wait_time = {priority: 0.0 for priority in PRIORITY_NAMES}
+
+    def _can_admit(self, ticket) -> bool:
+        """Whether the given waiting ticket may start now."""
+        if self._waiting[0] != ticket:
+            return False
+        slots = int(self.limit)
+        if ticket[0] == PRIORITY_BULK:
+            # Keep the last slot free for input and memory requests
+            slots -= 1
+        return self.in_flight < slots
+
+    @contextmanager
+    def slot(self, priority: int):
+        """Wait for a slot in the given priority class and hold it.
+
+        Args:
+            priority: One of PRIORITY_INPUT, PRIORITY_MEMORY or PRIORITY_BULK
+        """
+        queued_at = time.perf_counter()
+        with self._cond:
+            self._sequence += 1
+            ticket = (priority, self._sequence)
+            heapq.heappush(self._waiting, ticket)
+            self.queue_depth[priority] += 1
+            try:
+                self._cond.wait_for(lambda: self._can_admit(ticket))
+            finally:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self.queue_depth[priority] -= 1
+                # The next ticket in line may be admissible now
+                self._cond.notify_all()
+            self.in_flight += 1
+
+        started_at = time.perf_counter()
+        succeeded = False
+        try:
+            yield
+            succeeded = True
+        finally:
+            self._release(priority, started_at - queued_at, time.perf_counter() - started_at, succeeded)
+
+    def _ewma(self, average: float, sample: float) -> float:
+        """Update an exponentially weighted moving average."""
+        if average == 0.0:
+            return sample
+        return average + self.smoothing * (sample - average)
+
+    def _release(self, priority: int, waited: float, latency: float, succeeded: bool):
+        """Free a slot, record metrics and adapt the concurrency limit."""
+        with self._cond:
+            self.in_flight -= 1
+            self.wait_time[priority] = self._ewma(self.wait_time[priority], waited)
+            self.latency[priority] = self._ewma(self.latency[priority], latency)
+            if succeeded:
+                self.completed[priority] += 1
+            else:
+                self.errors[priority] += 1
+
+            if priority != PRIORITY_BULK:
+                if succeeded and latency <= self.target_latency:
+                    # Additive increase: roughly one extra slot per limit's worth of requests
+                    self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+                else:
+                    # Multiplicative decrease
+                    self.limit = max(self.min_limit, self.limit * 0.5)
+
+            self._cond.notify_all()
+
+    def metrics(self) -> Dict:
+        """Snapshot of queue depths, latencies and the current limit."""
+        with self._cond:
+            return {
+                "limit": int(self.limit),
+                "in_flight": self.in_flight,
+                "classes": {
+                    name: {
+                        "queue_depth": self.queue_depth[priority],
+                        "completed": self.completed[priority],
+                        "errors": self.errors[priority],
+                        "avg_latency_ms": round(self.latency[priority] * 1000, 2),
+                        "avg_wait_ms": round(self.wait_time[priority] * 1000, 2),
+                    }
+                    for priority, name in PRIORITY_NAMES.items()
+                },
+            }
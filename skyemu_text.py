@@ -0,0 +1,123 @@
+"""
+SkyEmu Text Extraction
+
+Reads on-screen text straight from a game's tile map in emulated memory and
+decodes it through a per-game character table, avoiding screenshots and OCR.
+"""
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+from skyemu_client import SkyEmuClient
+
+def _pokemon_gen1_charmap() -> Dict[int, str]:
+    """Character table for Pokemon Red/Blue/Yellow (English)."""
+    charmap = {0x7F: " "}
+    for i in range(26):
+        charmap[0x80 + i] = chr(ord("A") + i)
+        charmap[0xA0 + i] = chr(ord("a") + i)
+    for i in range(10):
+        charmap[0xF6 + i] = str(i)
+    charmap.update({
+        0x9A: "(", 0x9B: ")", 0x9C: ":", 0x9D: ";", 0x9E: "[", 0x9F: "]",
+        0xBA: "é", 0xBB: "'d", 0xBC: "'l", 0xBD: "'s", 0xBE: "'t", 0xBF: "'v",
+        0xE0: "'", 0xE1: "PK", 0xE2: "MN", 0xE3: "-", 0xE4: "'r", 0xE5: "'m",
+        0xE6: "?", 0xE7: "!", 0xE8: ".",
+        0xED: "▶", 0xEE: "▼", 0xEF: "♂", 0xF0: "¥", 0xF1: "×", 0xF2: ".",
+        0xF3: "/", 0xF4: ",", 0xF5: "♀",
+    })
+    return charmap
+
+class GameTextLayout:
+    """Where a game keeps its screen tile map and how to decode it."""
+
+    def __init__(
+        self,
+        tilemap_address: int,
+        width: int,
+        height: int,
+        charmap: Dict[int, str],
+        regions: Dict[str, Tuple[int, int, int, int]],
+    ):
+        """Initialize the layout.
+
+        Args:
+            tilemap_address: Address of the first tile of the screen tile map
+            width: Tile map width in tiles
+            height: Tile map height in tiles
+            charmap: Mapping of tile IDs to text; unmapped tiles read as spaces
+            regions: Named (left, top, right, bottom) tile boxes, right/bottom exclusive
+        """
+        self.tilemap_address = tilemap_address
+        self.width = width
+        self.height = height
+        self.charmap = charmap
+        self.regions = regions
+
+# Supported games, keyed by the name used in the read_screen_text tool
+GAME_LAYOUTS: Dict[str, GameTextLayout] = {
+    # wTileMap in WRAM holds the 20x18 tile buffer copied to the screen
+    "pokemon_red_blue": GameTextLayout(
+        tilemap_address=0xC3A0,
+        width=20,
+        height=18,
+        charmap=_pokemon_gen1_charmap(),
+        regions={
+            "screen": (0, 0, 20, 18),
+            # Interior of the standard text box at the bottom of the screen
+            "dialogue": (1, 13, 19, 17),
+        },
+    ),
+}
+
+class TextReader:
+    """Reads and decodes text regions, caching results by tile bytes."""
+
+    def __init__(self, client: SkyEmuClient, cache_size: int = 256):
+        """Initialize the reader.
+
+        Args:
+            client: SkyEmu client used for memory reads
+            cache_size: Number of decoded buffers to remember
+        """
+        self.client = client
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, str, bytes], List[str]]" = OrderedDict()
+
+    def read_lines(self, game: str, region: str = "dialogue") -> List[str]:
+        """Read a region of the tile map and decode it into lines of text.
+
+        Args:
+            game: Key into GAME_LAYOUTS
+            region: Named region of the game's layout
+
+        Returns:
+            Non-empty decoded lines, top to bottom
+        """
+        if game not in GAME_LAYOUTS:
+            raise ValueError(f"Unsupported game: {game}")
+        layout = GAME_LAYOUTS[game]
+        if region not in layout.regions:
+            raise ValueError(f"Unknown region '{region}' for {game}")
+        left, top, right, bottom = layout.regions[region]
+
+        # Read whole rows covering the region in one request
+        start = layout.tilemap_address + top * layout.width
+        end = layout.tilemap_address + bottom * layout.width - 1
+        tiles = self.client.read_ranges([(start, end)])
+
+        key = (game, region, tiles)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        lines = []
+        for row in range(bottom - top):
+            row_tiles = tiles[row * layout.width + left:row * layout.width + right]
+            line = "".join(layout.charmap.get(tile, " ") for tile in row_tiles).rstrip()
+            if line.strip():
+                lines.append(line)
+
+        self._cache[key] = lines
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return lines
@@ -0,0 +1,166 @@
+"""
+SkyEmu Transports
+
+Pluggable backends that carry SkyEmuClient requests: HTTP over TCP, HTTP over
+a Unix domain socket, and direct in-process calls.
+"""
+import http.client
+import json
+import select
+import socket
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+import requests
+
+# Endpoints without side effects, which are safe to send twice
+READ_ONLY_ENDPOINTS = {"ping", "status", "read_byte", "screen"}
+
+class TransportResponse:
+    """Minimal response object with the parts of requests.Response the client uses."""
+
+    def __init__(self, status_code: int, content: bytes, url: str = ""):
+        self.status_code = status_code
+        self.content = content
+        self.url = url
+
+    @property
+    def text(self) -> str:
+        """Response body decoded as UTF-8."""
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """Response body parsed as JSON."""
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        """Raise requests.HTTPError for 4xx and 5xx responses, like requests does."""
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+class Transport(ABC):
+    """Base class for SkyEmu transports."""
+
+    @abstractmethod
+    def request(self, endpoint: str, params: Optional[Dict[str, Any]] = None):
+        """Send a GET request.
+
+        Args:
+            endpoint: API endpoint path without the leading slash
+            params: Query parameters; list values become repeated parameters
+
+        Returns:
+            A response with status_code, content, text, json() and raise_for_status()
+        """
+
+    def close(self):
+        """Release any connections held by the transport."""
+
+class HttpTransport(Transport):
+    """HTTP over TCP with a keep-alive session; the default transport."""
+
+    def __init__(self, host: str = "localhost", port: int = 8080):
+        self.base_url = f"http://{host}:{port}"
+        self.session = requests.Session()
+
+    def request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        return self.session.get(f"{self.base_url}/{endpoint}", params=params)
+
+    def close(self):
+        self.session.close()
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """http.client connection over a Unix domain socket."""
+
+    def __init__(self, path: str, timeout: Optional[float] = None):
+        super().__init__("localhost", timeout=timeout)
+        self.unix_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.unix_path)
+
+class UnixSocketTransport(Transport):
+    """HTTP over a Unix domain socket, skipping the TCP stack for colocated processes.
+
+    SkyEmu listens on TCP, so this needs SkyEmu behind a local socket proxy
+    (e.g. socat) or a server that listens on a Unix socket directly.
+    Each thread keeps its own persistent connection. A connection the server
+    closed while idle is replaced before use; if a reused connection still fails
+    before any response arrives, only read-only requests are retried, so inputs
+    and writes are never sent twice.
+    """
+
+    def __init__(self, path: str, timeout: Optional[float] = None):
+        """Initialize the transport.
+
+        Args:
+            path: Path of the Unix domain socket
+            timeout: Optional socket timeout in seconds
+        """
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> _UnixHTTPConnection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = _UnixHTTPConnection(self.path, self.timeout)
+            self._local.connection = connection
+        elif connection.sock is not None and select.select([connection.sock], [], [], 0)[0]:
+            # An idle connection is only readable once the server has closed it
+            connection.close()
+        return connection
+
+    def request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> TransportResponse:
+        url = f"/{endpoint}"
+        if params:
+            url += "?" + urlencode(params, doseq=True)
+
+        connection = self._connection()
+        reused = connection.sock is not None
+        try:
+            connection.request("GET", url)
+            response = connection.getresponse()
+        except (ConnectionError, http.client.HTTPException):
+            connection.close()
+            # Without a response we cannot tell whether SkyEmu acted on the request
+            if not reused or endpoint not in READ_ONLY_ENDPOINTS:
+                raise
+            connection.request("GET", url)
+            response = connection.getresponse()
+        try:
+            content = response.read()
+        except (ConnectionError, http.client.HTTPException):
+            connection.close()
+            raise
+        return TransportResponse(response.status, content, url)
+
+    def close(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+class InProcessTransport(Transport):
+    """Calls a handler directly, with no sockets or URL encoding.
+
+    The handler receives (endpoint, params) and returns (status_code, body),
+    as implemented by skyemu_fake.FakeSkyEmu.handle.
+    """
+
+    def __init__(self, handler: Callable[[str, Dict[str, Any]], Tuple[int, bytes]]):
+        """Initialize the transport.
+
+        Args:
+            handler: Function handling a request in-process
+        """
+        self.handler = handler
+
+    def request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> TransportResponse:
+        status_code, content = self.handler(endpoint, params or {})
+        return TransportResponse(status_code, content, f"/{endpoint}")
@@ -0,0 +1,28 @@
+"""Shared fixtures: a FakeSkyEmu reached through the in-process transport."""
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path so we can import the top-level modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from skyemu_client import SkyEmuClient
+from skyemu_fake import FakeSkyEmu
+from skyemu_transport import InProcessTransport
+
+@pytest.fixture
+def fake():
+    return FakeSkyEmu()
+
+@pytest.fixture
+def requests_seen():
+    """Endpoints requested through the client fixture, in order."""
+    return []
+
+@pytest.fixture
+def client(fake, requests_seen):
+    def handler(endpoint, params):
+        requests_seen.append(endpoint)
+        return fake.handle(endpoint, params)
+
+    return SkyEmuClient(transport=InProcessTransport(handler), check_connection=False)
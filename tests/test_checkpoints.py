@@ -0,0 +1,27 @@
+import pytest
+
+from skyemu_checkpoints import CheckpointStore
+
+def test_add_appends_and_resolves_prefix(tmp_path):
+    store = CheckpointStore(str(tmp_path))
+    first = store.add(b"first", "one", thumbnail=b"thumb")
+    store.add(b"second", "two")
+
+    assert [entry["label"] for entry in CheckpointStore(str(tmp_path)).list_entries()] == ["two", "one"]
+    assert store.resolve(first["id"][:8]) == store.object_path(first["id"])
+    with open(store.object_path(first["id"]), "rb") as f:
+        assert f.read() == b"first"
+    with pytest.raises(KeyError):
+        store.resolve("not-an-id")
+
+def test_index_recovers_from_interrupted_write(tmp_path):
+    store = CheckpointStore(str(tmp_path))
+    store.add(b"first", "one")
+    with open(store.index_path, "a") as f:
+        f.write('{"id": "trunc')
+
+    reopened = CheckpointStore(str(tmp_path))
+    reopened.add(b"second", "two")
+
+    labels = [entry["label"] for entry in CheckpointStore(str(tmp_path)).list_entries()]
+    assert labels == ["two", "one"]
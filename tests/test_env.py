@@ -0,0 +1,34 @@
+import numpy as np
+
+from skyemu_env import ReadPlan, SkyEmuEnv
+
+def test_read_plan_coalesces_ranges_and_keeps_observation_order():
+    plan = ReadPlan([0x10, 0x12, 0x40, 0x11], max_gap=16)
+
+    assert plan.ranges == [(0x10, 0x12), (0x40, 0x40)]
+    assert plan.size == 4
+    assert plan.index.tolist() == [0, 2, 3, 1]
+
+def test_read_plan_reads_all_addresses_in_one_request(fake, client, requests_seen):
+    for addr, value in {0x10: 1, 0x11: 2, 0x12: 3, 0x40: 4}.items():
+        fake.memory[(0, addr)] = value
+    plan = ReadPlan([0x40, 0x10, 0x12, 0x11])
+
+    obs = plan.read(client)
+
+    assert obs.dtype == np.uint8
+    assert obs.tolist() == [4, 1, 3, 2]
+    assert requests_seen == ["read_byte"]
+
+def test_repeated_action_is_pressed_again(fake, client, requests_seen, tmp_path):
+    state = tmp_path / "start.png"
+    state.write_bytes(b"")
+    env = SkyEmuEnv(client, str(state), [0xD35E], actions=[[], ["A"]])
+    env.reset()
+    inputs = []
+    client.set_input = lambda state: inputs.append(state["A"])
+
+    env.step(1)
+    env.step(1)
+
+    assert inputs == [1, 0, 1]
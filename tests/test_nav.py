@@ -0,0 +1,51 @@
+from skyemu_nav import Navigator, WorldGraph, next_direction
+
+def test_plan_assumes_unexplored_tiles_on_goal_map_are_walkable():
+    graph = WorldGraph()
+
+    assert graph.plan((1, 0, 0), (1, 2, 0)) == ["Right", "Right"]
+
+def test_move_is_blocked_only_after_two_failures():
+    graph = WorldGraph()
+
+    graph.record((1, 0, 0), "Right", (1, 0, 0))
+    assert not graph.is_blocked((1, 0, 0), "Right")
+    graph.record((1, 0, 0), "Right", (1, 0, 0))
+    assert graph.is_blocked((1, 0, 0), "Right")
+
+def test_plan_routes_around_blocked_moves():
+    graph = WorldGraph()
+    graph.blocked.add((1, 0, 0, "Right"))
+
+    path = graph.plan((1, 0, 0), (1, 1, 0))
+
+    assert len(path) == 3
+    assert path[0] != "Right"
+
+def test_plan_uses_known_warps_between_maps():
+    graph = WorldGraph()
+    graph.record((1, 5, 5), "Up", (2, 3, 3))
+
+    assert graph.plan((1, 5, 5), (2, 3, 4)) == ["Up", "Down"]
+    assert graph.plan((1, 5, 5), (3, 0, 0)) is None
+
+def test_route_presses_again_after_turning_in_place(client):
+    navigator = Navigator(client)
+    route = navigator.route((1, 0, 0), (1, 2, 0))
+
+    assert next(route) == "Right"
+    # The player only turned; the same direction is pressed again without replanning
+    assert next_direction(route, (1, 0, 0)) == "Right"
+    assert next_direction(route, (1, 1, 0)) == "Right"
+    assert next_direction(route, (1, 2, 0)) is None
+    assert navigator.graph.edges[(1, 0, 0, "Right")] == (1, 1, 0)
+
+def test_graph_json_round_trip():
+    graph = WorldGraph()
+    graph.record((1, 0, 0), "Up", (2, 4, 4))
+    graph.blocked.add((1, 0, 0, "Left"))
+
+    restored = WorldGraph.from_json(graph.to_json())
+
+    assert restored.edges == graph.edges
+    assert restored.blocked == graph.blocked
@@ -0,0 +1,85 @@
+import threading
+import time
+
+import pytest
+
+from skyemu_scheduler import PRIORITY_BULK, PRIORITY_INPUT, PRIORITY_MEMORY, RequestScheduler
+
+def hold_slot(scheduler, priority, entered, release):
+    """Start a thread that takes a slot, signals entered and waits for release."""
+    def run():
+        with scheduler.slot(priority):
+            entered.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+def wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.001)
+
+def test_min_limit_must_keep_a_slot_reserved():
+    with pytest.raises(ValueError):
+        RequestScheduler(min_limit=1)
+    with pytest.raises(ValueError):
+        RequestScheduler(min_limit=3, max_limit=2)
+
+def test_bulk_never_takes_the_last_slot():
+    scheduler = RequestScheduler(min_limit=2, max_limit=2)
+    release = threading.Event()
+    first_bulk = threading.Event()
+    second_bulk = threading.Event()
+
+    hold_slot(scheduler, PRIORITY_BULK, first_bulk, release)
+    assert first_bulk.wait(2)
+    hold_slot(scheduler, PRIORITY_BULK, second_bulk, release)
+    wait_until(lambda: scheduler.queue_depth[PRIORITY_BULK] == 1)
+
+    # The remaining slot is reserved, so an input is admitted at once
+    with scheduler.slot(PRIORITY_INPUT):
+        assert scheduler.in_flight == 2
+    assert not second_bulk.is_set()
+
+    release.set()
+    assert second_bulk.wait(2)
+
+def test_waiting_input_is_admitted_before_earlier_bulk():
+    scheduler = RequestScheduler(min_limit=2, max_limit=2)
+    release_memory = threading.Event()
+    memory_entered = threading.Event()
+    order = []
+
+    hold_slot(scheduler, PRIORITY_MEMORY, memory_entered, release_memory)
+    hold_slot(scheduler, PRIORITY_MEMORY, threading.Event(), release_memory)
+    wait_until(lambda: scheduler.in_flight == 2)
+
+    def request(priority, name):
+        with scheduler.slot(priority):
+            order.append(name)
+
+    bulk = threading.Thread(target=request, args=(PRIORITY_BULK, "bulk"))
+    bulk.start()
+    wait_until(lambda: scheduler.queue_depth[PRIORITY_BULK] == 1)
+    user_input = threading.Thread(target=request, args=(PRIORITY_INPUT, "input"))
+    user_input.start()
+    wait_until(lambda: scheduler.queue_depth[PRIORITY_INPUT] == 1)
+
+    release_memory.set()
+    bulk.join(2)
+    user_input.join(2)
+    assert order == ["input", "bulk"]
+
+def test_limit_shrinks_on_slow_requests_but_not_below_min():
+    scheduler = RequestScheduler(min_limit=2, max_limit=8, target_latency=0.0)
+    scheduler.limit = 8.0
+
+    for _ in range(5):
+        with scheduler.slot(PRIORITY_INPUT):
+            time.sleep(0.001)
+
+    assert scheduler.limit == 2
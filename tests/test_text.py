@@ -0,0 +1,27 @@
+from skyemu_text import GAME_LAYOUTS, TextReader
+
+LAYOUT = GAME_LAYOUTS["pokemon_red_blue"]
+
+def write_text(fake, row, column, text):
+    """Encode uppercase text into the fake tile map."""
+    address = LAYOUT.tilemap_address + row * LAYOUT.width + column
+    for offset, char in enumerate(text):
+        tile = 0x7F if char == " " else 0x80 + ord(char) - ord("A")
+        fake.memory[(0, address + offset)] = tile
+
+def test_reads_dialogue_lines(fake, client):
+    write_text(fake, 14, 1, "HELLO THERE")
+    write_text(fake, 16, 1, "WELCOME")
+
+    assert TextReader(client).read_lines("pokemon_red_blue") == ["HELLO THERE", "WELCOME"]
+
+def test_dialogue_excludes_text_box_border(fake, client):
+    write_text(fake, 14, 0, "XAB")
+
+    assert TextReader(client).read_lines("pokemon_red_blue", "dialogue") == ["AB"]
+    assert TextReader(client).read_lines("pokemon_red_blue", "screen") == ["XAB"]
+
+def test_region_is_read_in_one_request(client, requests_seen):
+    TextReader(client).read_lines("pokemon_red_blue", "screen")
+
+    assert requests_seen == ["read_byte"]
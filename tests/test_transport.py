@@ -0,0 +1,84 @@
+import http.client
+import os
+import socket
+import tempfile
+import threading
+
+import pytest
+
+from skyemu_transport import InProcessTransport, Transport, UnixSocketTransport
+
+class DroppingServer:
+    """Unix socket server answering the first request on each connection and
+    closing the connection without a response on the second."""
+
+    def __init__(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "skyemu.sock")
+        self.requests = []
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.bind(self.path)
+        self.sock.listen()
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                connection, _ = self.sock.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(connection,), daemon=True).start()
+
+    def _handle(self, connection):
+        with connection:
+            for answered in (False, True):
+                data = b""
+                while b"\r\n\r\n" not in data:
+                    chunk = connection.recv(4096)
+                    if not chunk:
+                        return
+                    data += chunk
+                self.requests.append(data.split(b" ")[1].decode())
+                if answered:
+                    return
+                connection.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+
+    def close(self):
+        self.sock.close()
+
+@pytest.fixture
+def server():
+    server = DroppingServer()
+    yield server
+    server.close()
+
+def test_transport_is_abstract():
+    with pytest.raises(TypeError):
+        Transport()
+
+def test_in_process_transport_response(fake):
+    transport = InProcessTransport(fake.handle)
+
+    assert transport.request("ping").text == "pong"
+    with pytest.raises(Exception):
+        transport.request("missing").raise_for_status()
+
+def test_read_only_request_is_retried_on_a_fresh_connection(server):
+    transport = UnixSocketTransport(server.path, timeout=5)
+    transport.request("ping")
+
+    assert transport.request("status").text == "ok"
+    assert server.requests == ["/ping", "/status", "/status"]
+
+def test_input_is_never_sent_twice(server):
+    transport = UnixSocketTransport(server.path, timeout=5)
+    transport.request("ping")
+
+    with pytest.raises((ConnectionError, http.client.HTTPException)):
+        transport.request("input", {"A": 1})
+    assert server.requests == ["/ping", "/input?A=1"]
+
+def test_fresh_connection_failure_is_not_retried(server):
+    transport = UnixSocketTransport(server.path + ".missing", timeout=5)
+
+    with pytest.raises(OSError):
+        transport.request("status")